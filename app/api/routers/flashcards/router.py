@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from app.core.security import get_api_key
 from app.db import async_session
 from app.api.routers.flashcards.service import Service
@@ -18,7 +18,8 @@ from app.schemas.flashcards.input.deck import (
     DeckGetInput,
     DeckUpdateInput,
     DeckCreateInput,
-    DeckListInput
+    DeckListInput,
+    DECK_NAME_MAX_LENGTH
 )
 from app.schemas.flashcards.output.deck import (
     DeckGetOutput,
@@ -212,7 +213,7 @@ async def search_cards(
     dependencies=[Depends(get_api_key)]
 )
 async def create_deck(
-    name: str,
+    name: str = Query(max_length=DECK_NAME_MAX_LENGTH),
 ) -> DeckCreateOutput:
     async with async_session() as session:
         return await Service.create_deck(
@@ -283,7 +284,7 @@ async def delete_deck(
 )
 async def update_deck(
     deck_id: int,
-    name: str = None,
+    name: str = Query(default=None, max_length=DECK_NAME_MAX_LENGTH),
     config_id: int = None,
     user_timezone_offset_minutes: int = 0
 ) -> DeckUpdateOutput:
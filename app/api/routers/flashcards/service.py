@@ -1,9 +1,10 @@
 from uuid import uuid4
 import time
-from typing import List
+from typing import Dict, List, Tuple
 
+from sqlalchemy.exc import IntegrityError
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select, func
+from sqlmodel import col, select, func, insert
 
 from app.models.flashcards.card import Card
 from app.models.flashcards.collection import Collection
@@ -48,9 +49,13 @@ from app.schemas.flashcards.output.deck import (
 )
 from app.helper import (
     get_user_localtime,
-    anki_field_checksum
+    anki_field_checksum,
+    sm2_step
 )
 
+# Attempts at inserting a review batch before a revlog id clash is raised
+REVLOG_ID_ATTEMPTS = 5
+
 
 class Service:
     # Cards
@@ -62,6 +67,30 @@ class Service:
     async def create_card(
         session: AsyncSession,
         data: FlashcardCreateInput
+    ) -> FlashcardCreateOutput:
+        result = await Service._add_card(session, data)
+        await session.commit()
+        return result
+
+    @staticmethod
+    async def create_cards(
+        session: AsyncSession,
+        data: List[FlashcardCreateInput]
+    ) -> List[FlashcardCreateOutput]:
+        # All cards are created in one transaction: if any input fails, the
+        # items already flushed are rolled back, so nothing can commit them
+        try:
+            results = [await Service._add_card(session, item) for item in data]
+        except Exception:
+            await session.rollback()
+            raise
+        await session.commit()
+        return results
+
+    @staticmethod
+    async def _add_card(
+        session: AsyncSession,
+        data: FlashcardCreateInput
     ) -> FlashcardCreateOutput:
         # Fetch deck
         deck = (await session.exec(
@@ -87,14 +116,15 @@ class Service:
             select(Template).where(Template.ntid == notetype.id)
         )).all()
 
-        # Check for existing note (by checksum)
+        # Check for existing note: the checksum narrows the candidates, and
+        # as in Anki the stored front decides, since 32-bit checksums collide
         csum = anki_field_checksum(data.front)
-        existing_note = (await session.exec(
-            select(Note)
+        candidate_flds = (await session.exec(
+            select(Note.flds)
             .where(Note.csum == csum)
             .where(Note.mid == notetype.id)
-        )).first()
-        if existing_note:
+        )).all()
+        if any(flds.split('\x1f')[0] == data.front for flds in candidate_flds):
             raise ValueError(
                 'Note with same sort field already exists in this notetype.'
             )
@@ -113,8 +143,7 @@ class Service:
             data=''
         )
         session.add(note)
-        await session.commit()
-        await session.refresh(note)
+        await session.flush()
 
         created_cards: List[Card] = []
         for t in templates:
@@ -150,8 +179,7 @@ class Service:
             session.add(card)
             created_cards.append(card)
 
-        await session.commit()
-        await session.refresh(created_cards[0])
+        await session.flush()
 
         # Return in FlashcardCreateOutput format
         front, back = note.flds.split('\x1f')
@@ -210,20 +238,104 @@ class Service:
         session: AsyncSession,
         data: FlashcardReviewInput
     ) -> FlashcardReviewOutput:
-        card = (await session.exec(
-            select(Card).where(Card.id == data.card_id)
-        )).first()
+        card = await session.get(Card, data.card_id)
         if not card:
             raise ValueError('Card not found')
 
-        mod = int(get_user_localtime(
+        return (await Service._log_reviews(session, {card.id: card}, [data]))[0]
+
+    @staticmethod
+    async def review_cards(
+        session: AsyncSession,
+        data: List[FlashcardReviewInput]
+    ) -> List[FlashcardReviewOutput]:
+        # Load every card with one query and commit all reviews together:
+        # if any card is missing, nothing is committed
+        if not data:
+            return []
+
+        card_ids = {item.card_id for item in data}
+        cards = {
+            card.id: card
+            for card in (await session.exec(
+                select(Card).where(col(Card.id).in_(card_ids))
+            )).all()
+        }
+        if len(cards) != len(card_ids):
+            raise ValueError('Card not found')
+
+        return await Service._log_reviews(session, cards, data)
+
+    @staticmethod
+    async def _log_reviews(
+        session: AsyncSession,
+        cards: Dict[int, Card],
+        data: List[FlashcardReviewInput]
+    ) -> List[FlashcardReviewOutput]:
+        # Revlog ids start at the review time in milliseconds, so the max id
+        # is only looked up when one of them is already taken; the reviews
+        # are then applied again to the reloaded cards. A concurrent review
+        # can take the id past the max too, hence the retries
+        last_revlog_id = 0
+        for _ in range(REVLOG_ID_ATTEMPTS - 1):
+            try:
+                return await Service._commit_reviews(
+                    session, cards, data, last_revlog_id
+                )
+            except IntegrityError:
+                await session.rollback()
+
+            for card in cards.values():
+                await session.refresh(card)
+            last_revlog_id = await Service._last_revlog_id(session)
+
+        return await Service._commit_reviews(
+            session, cards, data, last_revlog_id
+        )
+
+    @staticmethod
+    async def _commit_reviews(
+        session: AsyncSession,
+        cards: Dict[int, Card],
+        data: List[FlashcardReviewInput],
+        last_revlog_id: int
+    ) -> List[FlashcardReviewOutput]:
+        reviews = []
+        for item in data:
+            result, revlog = Service._apply_review(
+                cards[item.card_id], item, last_revlog_id
+            )
+            last_revlog_id = revlog['id']
+            reviews.append((result, revlog))
+
+        await session.exec(
+            insert(RevLog), params=[revlog for _, revlog in reviews]
+        )
+        await session.commit()
+        return [result for result, _ in reviews]
+
+    @staticmethod
+    async def _last_revlog_id(session: AsyncSession) -> int:
+        return (await session.exec(select(func.max(RevLog.id)))).one() or 0
+
+    @staticmethod
+    def _apply_review(
+        card: Card,
+        data: FlashcardReviewInput,
+        last_revlog_id: int
+    ) -> Tuple[FlashcardReviewOutput, dict]:
+        # Returns the review output and the revlog row for the caller to
+        # insert, so batches go out as a single executemany
+        reviewed_at = get_user_localtime(
             user_timezone_offset_minutes=data.user_timezone_offset_minutes
-        ).timestamp())
+        ).timestamp()
+        mod = int(reviewed_at)
         last_ivl = card.ivl
 
-        # Log review
-        revlog_entry = RevLog(
-            id=mod * 1000,
+        # Log review; like Anki, the id is the review time in milliseconds,
+        # bumped past the last id when reviews land in the same millisecond
+        revlog = dict(
+            id=max(int(reviewed_at * 1000), last_revlog_id + 1),
             cid=card.id,
             usn=0,
             ease=data.ease,
@@ -233,45 +345,28 @@ class Service:
             time=data.review_time_ms,
             type=card.type_id,
         )
-        session.add(revlog_entry)
-
-        if card.type_id == CardTypeEnum.NEW.value:
-            card.type_id = CardTypeEnum.LEARNING.value
-            card.queue_id = QueueTypeEnum.LEARNING.value
-            card.ivl = 0
-            card.due = mod + 600  # next due in 10min for learning
-        elif card.type_id == CardTypeEnum.LEARNING.value:
-            card.type_id = CardTypeEnum.REVIEW.value
-            card.queue_id = QueueTypeEnum.REVIEW.value
-            card.ivl = 1
-            card.due = mod + 86400  # due in 1 day (in seconds)
-        elif card.type_id == CardTypeEnum.REVIEW.value:
-            if data.ease == 1:
-                card.lapses += 1
-                card.ivl = 1
-                card.due = mod + 86400
-                card.factor = max(1300, card.factor - 200)
-            else:
-                if data.ease == 2:  # Hard
-                    card.ivl = max(1, int(card.ivl * 1.2))
-                    card.factor = max(1300, card.factor - 150)
-                elif data.ease == 3:  # Good
-                    card.ivl = max(1, int(card.ivl * card.factor / 1000))
-                elif data.ease == 4:  # Easy
-                    card.ivl = max(1, int(card.ivl * card.factor / 1000 * 1.3))
-                card.due = mod + card.ivl * 86400
-        elif card.type_id == CardTypeEnum.RELEARNING.value:
-            card.type_id = CardTypeEnum.REVIEW.value
-            card.queue_id = QueueTypeEnum.REVIEW.value
-            card.ivl = 1  # reset to 1 day
-            card.due = mod + 86400
+
+        (
+            card.type_id,
+            card.queue_id,
+            card.ivl,
+            card.factor,
+            card.lapses,
+            card.due
+        ) = sm2_step(
+            card.type_id,
+            card.queue_id,
+            card.ivl,
+            card.factor,
+            card.lapses,
+            card.due,
+            data.ease,
+            mod
+        )
 
         card.reps += 1
         card.mod = mod
 
-        await session.commit()
-        await session.refresh(card)
-
         return FlashcardReviewOutput(
             card_id=card.id,
             new_due=card.due,
@@ -282,8 +377,8 @@ class Service:
             reps=card.reps,
             lapses=card.lapses,
             reviewed_at=mod,
-            revlog_id=revlog_entry.id
-        )
+            revlog_id=revlog['id']
+        ), revlog
 
     @staticmethod
     async def get_card(
@@ -404,9 +499,7 @@ class Service:
         data: FlashcardDeleteInput
     ) -> FlashcardDeleteOutput:
 
-        card = (await session.exec(
-            select(Card).where(Card.id == data.card_id)
-        )).first()
+        card = await session.get(Card, data.card_id)
 
         if not card:
             raise ValueError(f'Card with id {data.card_id} not found')
@@ -426,9 +519,7 @@ class Service:
 
         # If no other cards use this note, delete the note too
         if len(remaining_cards) == 0:
-            note = (await session.exec(
-                select(Note).where(Note.id == note_id)
-            )).first()
+            note = await session.get(Note, note_id)
             if note:
                 await session.delete(note)
 
@@ -527,11 +618,7 @@ class Service:
         session: AsyncSession,
         data: DeckGetInput
     ) -> DeckGetOutput:
-        deck = (
-            await session.exec(
-                select(Deck).where(Deck.id == data.deck_id)
-            )
-        ).first()
+        deck = await session.get(Deck, data.deck_id)
 
         if not deck:
             raise ValueError(f"Deck with id={data.deck_id} not found")
@@ -556,11 +643,7 @@ class Service:
         session: AsyncSession,
         data: DeckDeleteInput
     ) -> DeckDeleteOutput:
-        deck = (
-            await session.exec(
-                select(Deck).where(Deck.id == data.deck_id)
-            )
-        ).first()
+        deck = await session.get(Deck, data.deck_id)
 
         if not deck:
             raise ValueError(f"Deck with id={data.deck_id} not found")
@@ -607,11 +690,7 @@ class Service:
         session: AsyncSession,
         data: DeckUpdateInput
     ) -> DeckUpdateOutput:
-        deck = (
-            await session.exec(
-                select(Deck).where(Deck.id == data.deck_id)
-            )
-        ).first()
+        deck = await session.get(Deck, data.deck_id)
 
         if not deck:
             raise ValueError(f"Deck with id={data.deck_id} not found")
@@ -660,7 +739,10 @@ class Service:
         if data.deck_name is not None:
             query = query.where(Deck.name == data.deck_name)
         if data.tags is not None:
-            query = query.where(Note.tags.ilike(f'%{data.tags}%'))
+            # Tags are stored space-padded (' a b '), so padding each tag
+            # matches whole tags only: 'test' does not match 'testing'
+            for tag in data.tags.split():
+                query = query.where(Note.tags.ilike(f'% {tag} %'))
         if data.type_id is not None:
             query = query.where(Card.type_id == data.type_id)
 
@@ -28,6 +28,7 @@ class AppSettings(BaseSettings):
 
 class DatabaseSettings(BaseSettings):
     url: str
+    echo: bool = False
 
     class Config:
         env_prefix = 'DB_'
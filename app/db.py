@@ -5,7 +5,7 @@ from app.core.config import settings
 from typing import AsyncGenerator
 
 
-engine = create_async_engine(settings.db.url, echo=True)
+engine = create_async_engine(settings.db.url, echo=settings.db.echo)
 async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
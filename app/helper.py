@@ -1,12 +1,73 @@
 import datetime
 import hashlib
+from typing import Tuple
+
+from app.models.flashcards.card import CardTypeEnum, QueueTypeEnum
+
+# Plain ints for the scheduler, so it does not resolve enum members per review
+TYPE_NEW = CardTypeEnum.NEW.value
+TYPE_LEARNING = CardTypeEnum.LEARNING.value
+TYPE_REVIEW = CardTypeEnum.REVIEW.value
+TYPE_RELEARNING = CardTypeEnum.RELEARNING.value
+QUEUE_LEARNING = QueueTypeEnum.LEARNING.value
+QUEUE_REVIEW = QueueTypeEnum.REVIEW.value
 
 
 def anki_field_checksum(field: str) -> int:
-    return int.from_bytes(hashlib.sha1(field.encode('utf-8')).digest()[:8], 'big')
+    # Anki keeps the first 32 bits of the SHA-1, which fits a 64-bit column
+    return int.from_bytes(hashlib.sha1(field.encode('utf-8')).digest()[:4], 'big')
 
 
 def get_user_localtime(user_timezone_offset_minutes: int) -> datetime.datetime:
     utc_created = datetime.datetime.now(datetime.timezone.utc)
 
     return utc_created - datetime.timedelta(minutes=user_timezone_offset_minutes)
+
+
+def sm2_step(
+    type_id: int,
+    queue_id: int,
+    ivl: int,
+    factor: int,
+    lapses: int,
+    due: int,
+    ease: int,
+    now: int
+) -> Tuple[int, int, int, int, int, int]:
+    """
+    Schedule a single review at ``now`` without touching the database.
+
+    Returns the new ``(type_id, queue_id, ivl, factor, lapses, due)``.
+    """
+    if type_id == TYPE_NEW:
+        type_id = TYPE_LEARNING
+        queue_id = QUEUE_LEARNING
+        ivl = 0
+        due = now + 600  # next due in 10min for learning
+    elif type_id == TYPE_LEARNING:
+        type_id = TYPE_REVIEW
+        queue_id = QUEUE_REVIEW
+        ivl = 1
+        due = now + 86400  # due in 1 day (in seconds)
+    elif type_id == TYPE_REVIEW:
+        if ease == 1:
+            lapses += 1
+            ivl = 1
+            due = now + 86400
+            factor = max(1300, factor - 200)
+        else:
+            if ease == 2:  # Hard
+                ivl = max(1, int(ivl * 1.2))
+                factor = max(1300, factor - 150)
+            elif ease == 3:  # Good
+                ivl = max(1, int(ivl * factor / 1000))
+            elif ease == 4:  # Easy
+                ivl = max(1, int(ivl * factor / 1000 * 1.3))
+            due = now + ivl * 86400
+    elif type_id == TYPE_RELEARNING:
+        type_id = TYPE_REVIEW
+        queue_id = QUEUE_REVIEW
+        ivl = 1  # reset to 1 day
+        due = now + 86400
+
+    return type_id, queue_id, ivl, factor, lapses, due
@@ -77,13 +77,13 @@ class QueueType(SQLModel, table=True):
 
 class Card(SQLModel, table=True):
     id: int = Field(default=None, primary_key=True)
-    nid: int = Field(foreign_key='note.id')
-    did: int = Field(foreign_key='deck.id')
+    nid: int = Field(foreign_key='note.id', index=True)
+    did: int = Field(foreign_key='deck.id', index=True)
     ord: int
     mod: int
     usn: int
 
-    type_id: int = Field(foreign_key='cardtype.id')
+    type_id: int = Field(foreign_key='cardtype.id', index=True)
     queue_id: int = Field(foreign_key='queuetype.id')
 
     due: int
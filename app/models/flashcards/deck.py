@@ -21,7 +21,7 @@ class DeckConfig(SQLModel, table=True):
 
 class Deck(SQLModel, table=True):
     id: int = Field(default=None, primary_key=True)
-    name: str
+    name: str = Field(index=True)
     mtime_secs: int
     usn: int
     common: bytes | None = None
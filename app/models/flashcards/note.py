@@ -1,6 +1,7 @@
 from app.models.flashcards.collection import Collection
 from app.models.flashcards.template import Template, FieldDef
 from typing import TYPE_CHECKING, List
+from sqlalchemy import BigInteger
 from sqlmodel import SQLModel, Field, Relationship
 
 if TYPE_CHECKING:
@@ -30,7 +31,7 @@ class Note(SQLModel, table=True):
     tags: str
     flds: str
     sfld: int
-    csum: int
+    csum: int = Field(sa_type=BigInteger, index=True)
     flags: int
     data: str
 
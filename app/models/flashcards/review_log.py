@@ -1,3 +1,4 @@
+from sqlalchemy import BigInteger
 from sqlmodel import Field, SQLModel, Relationship
 from typing import TYPE_CHECKING
 
@@ -6,8 +7,9 @@ if TYPE_CHECKING:
 
 
 class RevLog(SQLModel, table=True):
-    id: int = Field(default=None, primary_key=True)
-    cid: int = Field(foreign_key='card.id')
+    # Review time in milliseconds, as in Anki
+    id: int = Field(default=None, primary_key=True, sa_type=BigInteger)
+    cid: int = Field(foreign_key='card.id', index=True)
     usn: int
     ease: int
     ivl: int
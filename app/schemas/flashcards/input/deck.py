@@ -1,9 +1,12 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 
+# Also enforced on the router's query parameters, so oversized names get a 422
+DECK_NAME_MAX_LENGTH = 2048
+
 
 class DeckCreateInput(BaseModel):
-    name: str
+    name: str = Field(max_length=DECK_NAME_MAX_LENGTH)
 
 
 class DeckListInput(BaseModel):
@@ -22,6 +25,6 @@ class DeckDeleteInput(BaseModel):
 
 class DeckUpdateInput(BaseModel):
     deck_id: int                      # Current deck id
-    new_name: str | None = None    # New name (optional)
+    new_name: str | None = Field(default=None, max_length=DECK_NAME_MAX_LENGTH)  # New name (optional)
     config_id: int | None = None
     user_timezone_offset_minutes: Optional[int] = 0
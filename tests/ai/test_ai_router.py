@@ -4,7 +4,6 @@ Note: These are placeholder tests since the AI endpoints may require
 external API keys and specific configurations.
 """
 import pytest
-from httpx import AsyncClient, ASGITransport
 
 from app.main import app
 
@@ -13,41 +12,35 @@ class TestAIRouterBasics:
     """Basic tests for AI router setup."""
 
     @pytest.mark.anyio
-    async def test_ai_router_is_mounted(self):
+    async def test_ai_router_is_mounted(self, async_client):
         """Test that AI router is mounted at /ai prefix."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            # The router should exist - even if endpoints return 404/405
-            response = await client.get("/ai/")
-            
-            # We expect some response (not a complete failure)
-            assert response.status_code in [200, 404, 405, 401, 403, 422]
+        # The router should exist - even if endpoints return 404/405
+        response = await async_client.get("/ai/")
+        
+        # We expect some response (not a complete failure)
+        assert response.status_code in [200, 404, 405, 401, 403, 422]
 
     @pytest.mark.anyio
-    async def test_ai_router_prefix(self):
+    async def test_ai_router_prefix(self, async_client):
         """Test that AI endpoints are under /ai prefix."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            # Test a non-existent endpoint under /ai
-            response = await client.get("/ai/nonexistent")
-            
-            # Should get 404 or 405, not routing error
-            assert response.status_code in [404, 405, 401, 403]
+        # Test a non-existent endpoint under /ai
+        response = await async_client.get("/ai/nonexistent")
+        
+        # Should get 404 or 405, not routing error
+        assert response.status_code in [404, 405, 401, 403]
 
 
 class TestAIEndpointsAuthentication:
     """Tests for AI endpoint authentication."""
 
     @pytest.mark.anyio
-    async def test_ai_endpoints_require_auth(self):
+    async def test_ai_endpoints_require_auth(self, async_client):
         """Test that AI endpoints require authentication."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            # Without API key, should be rejected
-            response = await client.get("/ai/")
-            
-            # Expect auth error or method not allowed
-            assert response.status_code in [401, 403, 404, 405, 422]
+        # Without API key, should be rejected
+        response = await async_client.get("/ai/")
+        
+        # Expect auth error or method not allowed
+        assert response.status_code in [401, 403, 404, 405, 422]
 
 
 class TestAIEndpointsMocked:
@@ -68,18 +61,16 @@ class TestAIEndpointsIntegration:
     """Integration tests for AI endpoints."""
 
     @pytest.mark.anyio
-    async def test_ai_endpoint_response_format(self):
+    async def test_ai_endpoint_response_format(self, async_client):
         """Test that AI endpoints return proper JSON responses."""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/ai/")
-            
-            # If there's a response body, it should be valid JSON
-            if response.content:
-                try:
-                    data = response.json()
-                    # Valid JSON response
-                    assert isinstance(data, (dict, list, str, int, float, bool, type(None)))
-                except Exception:
-                    # Response might be empty or non-JSON which is fine for 404/405
-                    pass
+        response = await async_client.get("/ai/")
+        
+        # If there's a response body, it should be valid JSON
+        if response.content:
+            try:
+                data = response.json()
+                # Valid JSON response
+                assert isinstance(data, (dict, list, str, int, float, bool, type(None)))
+            except Exception:
+                # Response might be empty or non-JSON which is fine for 404/405
+                pass
@@ -1,13 +1,19 @@
 """
 Shared fixtures for FlashCard API tests.
 """
+import importlib.util
+from contextlib import asynccontextmanager
+
 import pytest
 from httpx import AsyncClient, ASGITransport
-from sqlmodel import SQLModel
+from sqlmodel import SQLModel, update
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from app.main import app
+from app.core.config import settings
+from app.api.routers.flashcards import router as router_module
 from app.models.flashcards.card import Card, CardType, QueueType, CardTypeEnum, QueueTypeEnum
 from app.models.flashcards.deck import Deck, DeckConfig
 from app.models.flashcards.note import Note, Notetype
@@ -22,59 +28,83 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 TEST_TIMESTAMP = 1700000000  # Fixed timestamp for testing
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def anyio_backend():
+    # uvloop is not available on Windows; fall back to the stock loop there
+    if importlib.util.find_spec("uvloop") is not None:
+        return 'asyncio', {'use_uvloop': True}
     return 'asyncio'
 
 
-@pytest.fixture
-async def test_engine():
-    """Create a test database engine."""
+def _enable_savepoints(engine):
+    """
+    Let pysqlite emit BEGIN itself so SAVEPOINTs nest inside the
+    per-test transaction (see the SQLAlchemy pysqlite docs).
+    """
+    @event.listens_for(engine.sync_engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+async def _create_engine():
+    """Create an in-memory test engine with the schema in place."""
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
         connect_args={"check_same_thread": False}
     )
+    _enable_savepoints(engine)
 
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
-    yield engine
+    return engine
+
 
+async def _dispose_engine(engine):
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.drop_all)
 
     await engine.dispose()
 
 
-@pytest.fixture
-async def test_session(test_engine):
-    """Create a test database session."""
-    async_session_maker = async_sessionmaker(
-        test_engine,
-        expire_on_commit=False,
-        class_=AsyncSession
-    )
-
-    async with async_session_maker() as session:
-        yield session
+@asynccontextmanager
+async def _rollback_session(engine):
+    """
+    Open a session inside a transaction that is rolled back on exit.
+    Commits made by the code under test only release a SAVEPOINT, so
+    every test starts from the data the engine was created with.
+    """
+    async with engine.connect() as conn:
+        await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await conn.rollback()
 
 
-@pytest.fixture
-async def seeded_session(test_session):
+async def _seed(session):
     """
-    Create a test session with seed data.
+    Insert the base seed data: lookup types, collection, deck config,
+    the Basic notetype with its template and a sample deck.
+    Everything goes out in one flush; the unit of work orders the
+    INSERTs by foreign key.
     """
-    session = test_session
     mtime = TEST_TIMESTAMP
 
-    # Create CardTypes
-    for ct in CardTypeEnum:
-        session.add(CardType(id=ct.value, name=ct.label))
-
-    # Create QueueTypes
-    for qt in QueueTypeEnum:
-        session.add(QueueType(id=qt.value, name=qt.label))
+    # Create CardTypes and QueueTypes
+    session.add_all(CardType(id=ct.value, name=ct.label) for ct in CardTypeEnum)
+    session.add_all(QueueType(id=qt.value, name=qt.label) for qt in QueueTypeEnum)
 
     # Create Collection
     collection = Collection(
@@ -108,8 +138,6 @@ async def seeded_session(test_session):
     )
     session.add(notetype)
 
-    await session.commit()
-
     # Create Template (composite primary key: ntid + ord)
     template = Template(
         ntid=1,
@@ -134,15 +162,11 @@ async def seeded_session(test_session):
 
     await session.commit()
 
-    yield session
 
-
-@pytest.fixture
-async def seeded_session_with_cards(seeded_session):
+async def _seed_cards(session):
     """
-    Create a session with seed data plus sample cards for testing.
+    Insert sample notes and cards on top of the base seed data.
     """
-    session = seeded_session
     mod = TEST_TIMESTAMP
 
     # Create sample notes and cards
@@ -194,31 +218,123 @@ async def seeded_session_with_cards(seeded_session):
 
     await session.commit()
 
-    yield session
+
+@pytest.fixture(scope="session")
+async def test_engine():
+    """Create the empty test database once per session."""
+    engine = await _create_engine()
+    yield engine
+    await _dispose_engine(engine)
+
+
+@pytest.fixture(scope="session")
+async def seeded_engine():
+    """Create a test database holding the base seed data once per session."""
+    engine = await _create_engine()
+    async with AsyncSession(engine) as session:
+        await _seed(session)
+    yield engine
+    await _dispose_engine(engine)
+
+
+@pytest.fixture(scope="session")
+async def seeded_engine_with_cards():
+    """Create a test database holding seed data plus sample cards once per session."""
+    engine = await _create_engine()
+    async with AsyncSession(engine) as session:
+        await _seed(session)
+        await _seed_cards(session)
+    yield engine
+    await _dispose_engine(engine)
 
 
 @pytest.fixture
+async def test_session(test_engine):
+    """Create a rolled-back test database session on an empty schema."""
+    async with _rollback_session(test_engine) as session:
+        yield session
+
+
+@pytest.fixture
+async def seeded_session(seeded_engine):
+    """
+    Create a test session with seed data.
+    """
+    async with _rollback_session(seeded_engine) as session:
+        yield session
+
+
+@pytest.fixture
+async def seeded_session_with_cards(seeded_engine_with_cards):
+    """
+    Create a session with seed data plus sample cards for testing.
+    """
+    async with _rollback_session(seeded_engine_with_cards) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def put_card():
+    """
+    Return a helper that puts a card into a given state with a single
+    UPDATE, e.g. ``await put_card(session, 3, type_id=..., ivl=10)``.
+    """
+    async def _put(session, card_id, **values):
+        # No commit: the UPDATE runs in the session's own transaction, and
+        # the per-test rollback undoes it on teardown. Objects already in
+        # the session are not refreshed, so put a card into state before
+        # the test loads it, and at most once per test.
+        await session.exec(
+            update(Card)
+            .where(Card.id == card_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    return _put
+
+
+@pytest.fixture(scope="session")
 def api_key_headers():
     """Headers with valid API key for authenticated requests."""
     return {"X-API-KEY": "test-secret-token"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_api_key_headers():
     """Headers with invalid API key."""
     return {"X-API-KEY": "invalid-key"}
 
 
 # For integration tests - simplified client without complex mocking
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def async_client():
-    """Create an async test client for basic endpoint testing."""
+    """Create an async test client shared by the whole test session."""
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
 
 @pytest.fixture
+async def authed_client(seeded_engine_with_cards, monkeypatch):
+    """
+    Create a client that passes the API key check, for probing query
+    validation. Each request gets a rolled-back session on the seeded
+    engine, and app errors come back as 500 responses instead of raising.
+    """
+    monkeypatch.setattr(
+        router_module, "async_session",
+        lambda: _rollback_session(seeded_engine_with_cards)
+    )
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    headers = {"X-API-KEY": settings.security.secret_token}
+    async with AsyncClient(
+        transport=transport, base_url="http://test", headers=headers
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
 async def async_client_with_cards():
     """Create an async test client for testing with cards."""
     transport = ASGITransport(app=app)
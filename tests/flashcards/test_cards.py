@@ -2,8 +2,52 @@
 Comprehensive integration tests for Card API endpoints.
 Tests endpoint availability, authentication, and request/response handling.
 """
+from types import MappingProxyType
+
 import pytest
 
+from app.main import app
+
+
+# Auth (401/403) or validation (422) may reject an unauthenticated request first
+AUTH_REQUIRED = frozenset({401, 403, 422})
+
+# Read-only base params for card creation; extend with {**CREATE_PARAMS, ...}
+CREATE_PARAMS = MappingProxyType({
+    "type_name": "Basic",
+    "deck_name": "Test Deck",
+    "front": "Q",
+    "back": "A"
+})
+
+# (method, path, params) for a well-formed request to every card endpoint
+CARD_ENDPOINTS = [
+    pytest.param("GET", "/flashcards/cards/list", None, id="list"),
+    pytest.param("GET", "/flashcards/cards/get", {"card_id": 1}, id="get"),
+    pytest.param("POST", "/flashcards/cards/create", CREATE_PARAMS, id="create"),
+    pytest.param(
+        "PUT", "/flashcards/cards/update",
+        {"card_id": 1, "front": "Updated"}, id="update"
+    ),
+    pytest.param("DELETE", "/flashcards/cards/delete", {"card_id": 1}, id="delete"),
+    pytest.param(
+        "POST", "/flashcards/cards/review",
+        {"card_id": 1, "ease": 3, "review_time_ms": 5000}, id="review"
+    ),
+    pytest.param("GET", "/flashcards/cards/search", {"query": "test"}, id="search"),
+]
+
+# (method, path, params) using an HTTP method the endpoint does not accept
+CARD_WRONG_METHODS = [
+    pytest.param("POST", "/flashcards/cards/list", None, id="list"),
+    pytest.param("POST", "/flashcards/cards/get", {"card_id": 1}, id="get"),
+    pytest.param("GET", "/flashcards/cards/create", None, id="create"),
+    pytest.param("POST", "/flashcards/cards/update", {"card_id": 1}, id="update"),
+    pytest.param("GET", "/flashcards/cards/delete", {"card_id": 1}, id="delete"),
+    pytest.param("GET", "/flashcards/cards/review", None, id="review"),
+    pytest.param("POST", "/flashcards/cards/search", {"query": "test"}, id="search"),
+]
+
 
 # =============================================================================
 # Authentication Tests
@@ -13,10 +57,11 @@ class TestCardEndpointsAuthentication:
     """Tests for API authentication on card endpoints."""
 
     @pytest.mark.anyio
-    async def test_list_cards_without_api_key(self, async_client):
-        """Test that list cards requires API key."""
-        response = await async_client.get("/flashcards/cards/list")
-        assert response.status_code in [401, 403, 422]
+    @pytest.mark.parametrize("method,path,params", CARD_ENDPOINTS)
+    async def test_endpoint_requires_api_key(self, async_client, method, path, params):
+        """Test that each card endpoint requires an API key."""
+        response = await async_client.request(method, path, params=params)
+        assert response.status_code in AUTH_REQUIRED
 
     @pytest.mark.anyio
     async def test_list_cards_with_invalid_api_key(self, async_client, invalid_api_key_headers):
@@ -27,65 +72,6 @@ class TestCardEndpointsAuthentication:
         )
         assert response.status_code == 403
 
-    @pytest.mark.anyio
-    async def test_get_card_without_api_key(self, async_client):
-        """Test that get card requires API key."""
-        response = await async_client.get(
-            "/flashcards/cards/get",
-            params={"card_id": 1}
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_create_card_without_api_key(self, async_client):
-        """Test that create card requires API key."""
-        response = await async_client.post(
-            "/flashcards/cards/create",
-            params={
-                "type_name": "Basic",
-                "deck_name": "Test",
-                "front": "Q",
-                "back": "A"
-            }
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_update_card_without_api_key(self, async_client):
-        """Test that update card requires API key."""
-        response = await async_client.put(
-            "/flashcards/cards/update",
-            params={"card_id": 1, "front": "Updated"}
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_delete_card_without_api_key(self, async_client):
-        """Test that delete card requires API key."""
-        response = await async_client.delete(
-            "/flashcards/cards/delete",
-            params={"card_id": 1}
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_review_card_without_api_key(self, async_client):
-        """Test that review card requires API key."""
-        response = await async_client.post(
-            "/flashcards/cards/review",
-            params={"card_id": 1, "ease": 3, "review_time_ms": 5000}
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_search_cards_without_api_key(self, async_client):
-        """Test that search cards requires API key."""
-        response = await async_client.get(
-            "/flashcards/cards/search",
-            params={"query": "test"}
-        )
-        assert response.status_code in [401, 403, 422]
-
 
 # =============================================================================
 # Endpoint Existence Tests
@@ -95,68 +81,10 @@ class TestCardEndpointsExist:
     """Tests that card endpoints are properly mounted."""
 
     @pytest.mark.anyio
-    async def test_cards_list_endpoint_exists(self, async_client):
-        """Test that cards list endpoint exists."""
-        response = await async_client.get("/flashcards/cards/list")
-        assert response.status_code != 404
-
-    @pytest.mark.anyio
-    async def test_cards_get_endpoint_exists(self, async_client):
-        """Test that cards get endpoint exists."""
-        response = await async_client.get(
-            "/flashcards/cards/get",
-            params={"card_id": 1}
-        )
-        assert response.status_code != 404
-
-    @pytest.mark.anyio
-    async def test_cards_create_endpoint_exists(self, async_client):
-        """Test that cards create endpoint exists."""
-        response = await async_client.post(
-            "/flashcards/cards/create",
-            params={
-                "type_name": "Basic",
-                "deck_name": "Test",
-                "front": "Q",
-                "back": "A"
-            }
-        )
-        assert response.status_code != 404
-
-    @pytest.mark.anyio
-    async def test_cards_update_endpoint_exists(self, async_client):
-        """Test that cards update endpoint exists."""
-        response = await async_client.put(
-            "/flashcards/cards/update",
-            params={"card_id": 1, "front": "Updated"}
-        )
-        assert response.status_code != 404
-
-    @pytest.mark.anyio
-    async def test_cards_delete_endpoint_exists(self, async_client):
-        """Test that cards delete endpoint exists."""
-        response = await async_client.delete(
-            "/flashcards/cards/delete",
-            params={"card_id": 1}
-        )
-        assert response.status_code != 404
-
-    @pytest.mark.anyio
-    async def test_cards_review_endpoint_exists(self, async_client):
-        """Test that cards review endpoint exists."""
-        response = await async_client.post(
-            "/flashcards/cards/review",
-            params={"card_id": 1, "ease": 3, "review_time_ms": 5000}
-        )
-        assert response.status_code != 404
-
-    @pytest.mark.anyio
-    async def test_cards_search_endpoint_exists(self, async_client):
-        """Test that cards search endpoint exists."""
-        response = await async_client.get(
-            "/flashcards/cards/search",
-            params={"query": "test"}
-        )
+    @pytest.mark.parametrize("method,path,params", CARD_ENDPOINTS)
+    async def test_endpoint_exists(self, async_client, method, path, params):
+        """Test that each card endpoint exists."""
+        response = await async_client.request(method, path, params=params)
         assert response.status_code != 404
 
 
@@ -168,57 +96,10 @@ class TestCardEndpointMethods:
     """Tests for correct HTTP methods on card endpoints."""
 
     @pytest.mark.anyio
-    async def test_list_cards_wrong_method(self, async_client):
-        """Test that list cards doesn't accept POST."""
-        response = await async_client.post("/flashcards/cards/list")
-        assert response.status_code == 405
-
-    @pytest.mark.anyio
-    async def test_get_card_wrong_method(self, async_client):
-        """Test that get card doesn't accept POST."""
-        response = await async_client.post(
-            "/flashcards/cards/get",
-            params={"card_id": 1}
-        )
-        assert response.status_code == 405
-
-    @pytest.mark.anyio
-    async def test_create_card_wrong_method(self, async_client):
-        """Test that create card doesn't accept GET."""
-        response = await async_client.get("/flashcards/cards/create")
-        assert response.status_code == 405
-
-    @pytest.mark.anyio
-    async def test_update_card_wrong_method(self, async_client):
-        """Test that update card doesn't accept POST."""
-        response = await async_client.post(
-            "/flashcards/cards/update",
-            params={"card_id": 1}
-        )
-        assert response.status_code == 405
-
-    @pytest.mark.anyio
-    async def test_delete_card_wrong_method(self, async_client):
-        """Test that delete card doesn't accept GET."""
-        response = await async_client.get(
-            "/flashcards/cards/delete",
-            params={"card_id": 1}
-        )
-        assert response.status_code == 405
-
-    @pytest.mark.anyio
-    async def test_review_card_wrong_method(self, async_client):
-        """Test that review card doesn't accept GET."""
-        response = await async_client.get("/flashcards/cards/review")
-        assert response.status_code == 405
-
-    @pytest.mark.anyio
-    async def test_search_cards_wrong_method(self, async_client):
-        """Test that search cards doesn't accept POST."""
-        response = await async_client.post(
-            "/flashcards/cards/search",
-            params={"query": "test"}
-        )
+    @pytest.mark.parametrize("method,path,params", CARD_WRONG_METHODS)
+    async def test_endpoint_wrong_method(self, async_client, method, path, params):
+        """Test that each card endpoint rejects an unsupported HTTP method."""
+        response = await async_client.request(method, path, params=params)
         assert response.status_code == 405
 
 
@@ -232,110 +113,66 @@ class TestCardRequestValidation:
     """
 
     @pytest.mark.anyio
-    async def test_get_card_missing_card_id(self, async_client):
-        """Test get card without card_id parameter."""
-        response = await async_client.get("/flashcards/cards/get")
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_create_card_missing_type_name(self, async_client):
-        """Test create card without type_name."""
-        response = await async_client.post(
-            "/flashcards/cards/create",
-            params={
-                "deck_name": "Test",
-                "front": "Q",
-                "back": "A"
-            }
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_create_card_missing_deck_name(self, async_client):
-        """Test create card without deck_name."""
-        response = await async_client.post(
-            "/flashcards/cards/create",
-            params={
-                "type_name": "Basic",
-                "front": "Q",
-                "back": "A"
-            }
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_create_card_missing_front(self, async_client):
-        """Test create card without front."""
-        response = await async_client.post(
-            "/flashcards/cards/create",
-            params={
-                "type_name": "Basic",
-                "deck_name": "Test",
-                "back": "A"
-            }
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_create_card_missing_back(self, async_client):
-        """Test create card without back."""
-        response = await async_client.post(
-            "/flashcards/cards/create",
-            params={
-                "type_name": "Basic",
-                "deck_name": "Test",
-                "front": "Q"
-            }
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_update_card_missing_card_id(self, async_client):
-        """Test update card without card_id."""
-        response = await async_client.put(
-            "/flashcards/cards/update",
-            params={"front": "Updated"}
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_delete_card_missing_card_id(self, async_client):
-        """Test delete card without card_id."""
-        response = await async_client.delete("/flashcards/cards/delete")
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_review_card_missing_card_id(self, async_client):
-        """Test review card without card_id."""
-        response = await async_client.post(
-            "/flashcards/cards/review",
-            params={"ease": 3, "review_time_ms": 5000}
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_review_card_missing_ease(self, async_client):
-        """Test review card without ease."""
-        response = await async_client.post(
-            "/flashcards/cards/review",
-            params={"card_id": 1, "review_time_ms": 5000}
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_review_card_missing_review_time(self, async_client):
-        """Test review card without review_time_ms."""
-        response = await async_client.post(
-            "/flashcards/cards/review",
-            params={"card_id": 1, "ease": 3}
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_search_cards_missing_query(self, async_client):
-        """Test search cards without query."""
-        response = await async_client.get("/flashcards/cards/search")
-        assert response.status_code in [401, 403, 422]
+    @pytest.mark.parametrize("method,path,params", [
+        pytest.param("GET", "/flashcards/cards/get", None, id="get-card_id"),
+        pytest.param(
+            "POST", "/flashcards/cards/create",
+            {"deck_name": "Test", "front": "Q", "back": "A"}, id="create-type_name"
+        ),
+        pytest.param(
+            "POST", "/flashcards/cards/create",
+            {"type_name": "Basic", "front": "Q", "back": "A"}, id="create-deck_name"
+        ),
+        pytest.param(
+            "POST", "/flashcards/cards/create",
+            {"type_name": "Basic", "deck_name": "Test", "back": "A"}, id="create-front"
+        ),
+        pytest.param(
+            "POST", "/flashcards/cards/create",
+            {"type_name": "Basic", "deck_name": "Test", "front": "Q"}, id="create-back"
+        ),
+        pytest.param(
+            "PUT", "/flashcards/cards/update",
+            {"front": "Updated"}, id="update-card_id"
+        ),
+        pytest.param("DELETE", "/flashcards/cards/delete", None, id="delete-card_id"),
+        pytest.param(
+            "POST", "/flashcards/cards/review",
+            {"ease": 3, "review_time_ms": 5000}, id="review-card_id"
+        ),
+        pytest.param(
+            "POST", "/flashcards/cards/review",
+            {"card_id": 1, "review_time_ms": 5000}, id="review-ease"
+        ),
+        pytest.param(
+            "POST", "/flashcards/cards/review",
+            {"card_id": 1, "ease": 3}, id="review-review_time_ms"
+        ),
+        pytest.param("GET", "/flashcards/cards/search", None, id="search-query"),
+    ])
+    async def test_missing_required_param(self, async_client, method, path, params):
+        """Test that omitting a required parameter is rejected."""
+        response = await async_client.request(method, path, params=params)
+        assert response.status_code in AUTH_REQUIRED
+
+    @pytest.mark.parametrize("method,path,required", [
+        pytest.param("get", "/flashcards/cards/get", {"card_id"}, id="get"),
+        pytest.param(
+            "post", "/flashcards/cards/create",
+            {"type_name", "deck_name", "front", "back"}, id="create"
+        ),
+        pytest.param("put", "/flashcards/cards/update", {"card_id"}, id="update"),
+        pytest.param("delete", "/flashcards/cards/delete", {"card_id"}, id="delete"),
+        pytest.param(
+            "post", "/flashcards/cards/review",
+            {"card_id", "ease", "review_time_ms"}, id="review"
+        ),
+        pytest.param("get", "/flashcards/cards/search", {"query"}, id="search"),
+    ])
+    def test_required_params_declared(self, method, path, required):
+        """Test that the OpenAPI schema marks the expected parameters as required."""
+        parameters = app.openapi()["paths"][path][method]["parameters"]
+        assert {p["name"] for p in parameters if p["required"]} >= required
 
 
 # =============================================================================
@@ -346,49 +183,22 @@ class TestCardPaginationParameters:
     """Tests for pagination parameters on list and search endpoints."""
 
     @pytest.mark.anyio
-    async def test_list_cards_with_limit(self, async_client):
-        """Test list cards accepts limit parameter."""
-        response = await async_client.get(
-            "/flashcards/cards/list",
-            params={"limit": 10}
-        )
-        # Should accept the parameter (might fail auth, but not validation)
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_list_cards_with_offset(self, async_client):
-        """Test list cards accepts offset parameter."""
-        response = await async_client.get(
-            "/flashcards/cards/list",
-            params={"offset": 5}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_list_cards_with_limit_and_offset(self, async_client):
-        """Test list cards accepts both limit and offset."""
-        response = await async_client.get(
-            "/flashcards/cards/list",
-            params={"limit": 10, "offset": 5}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_search_cards_with_limit(self, async_client):
-        """Test search cards accepts limit parameter."""
-        response = await async_client.get(
-            "/flashcards/cards/search",
-            params={"query": "test", "limit": 10}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_search_cards_with_offset(self, async_client):
-        """Test search cards accepts offset parameter."""
-        response = await async_client.get(
-            "/flashcards/cards/search",
-            params={"query": "test", "offset": 5}
-        )
+    @pytest.mark.parametrize("path,params", [
+        pytest.param("/flashcards/cards/list", {"limit": 10}, id="list-limit"),
+        pytest.param("/flashcards/cards/list", {"offset": 5}, id="list-offset"),
+        pytest.param(
+            "/flashcards/cards/list", {"limit": 10, "offset": 5}, id="list-limit-offset"
+        ),
+        pytest.param(
+            "/flashcards/cards/search", {"query": "test", "limit": 10}, id="search-limit"
+        ),
+        pytest.param(
+            "/flashcards/cards/search", {"query": "test", "offset": 5}, id="search-offset"
+        ),
+    ])
+    async def test_accepts_pagination(self, authed_client, path, params):
+        """Test that pagination parameters are accepted."""
+        response = await authed_client.get(path, params=params)
         assert response.status_code != 422
 
 
@@ -400,48 +210,23 @@ class TestCardFilterParameters:
     """Tests for filter parameters on list and search endpoints."""
 
     @pytest.mark.anyio
-    async def test_list_cards_with_deck_name(self, async_client):
-        """Test list cards accepts deck_name filter."""
-        response = await async_client.get(
-            "/flashcards/cards/list",
-            params={"deck_name": "Test Deck"}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_list_cards_with_type_id(self, async_client):
-        """Test list cards accepts type_id filter."""
-        response = await async_client.get(
-            "/flashcards/cards/list",
-            params={"type_id": 0}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_search_cards_with_deck_name(self, async_client):
-        """Test search cards accepts deck_name filter."""
-        response = await async_client.get(
-            "/flashcards/cards/search",
-            params={"query": "test", "deck_name": "Test Deck"}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_search_cards_with_tags(self, async_client):
-        """Test search cards accepts tags filter."""
-        response = await async_client.get(
-            "/flashcards/cards/search",
-            params={"query": "test", "tags": "important"}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_search_cards_with_type_id(self, async_client):
-        """Test search cards accepts type_id filter."""
-        response = await async_client.get(
+    @pytest.mark.parametrize("path,params", [
+        pytest.param("/flashcards/cards/list", {"deck_name": "Test Deck"}, id="list-deck_name"),
+        pytest.param("/flashcards/cards/list", {"type_id": 0}, id="list-type_id"),
+        pytest.param(
             "/flashcards/cards/search",
-            params={"query": "test", "type_id": 0}
-        )
+            {"query": "test", "deck_name": "Test Deck"}, id="search-deck_name"
+        ),
+        pytest.param(
+            "/flashcards/cards/search", {"query": "test", "tags": "important"}, id="search-tags"
+        ),
+        pytest.param(
+            "/flashcards/cards/search", {"query": "test", "type_id": 0}, id="search-type_id"
+        ),
+    ])
+    async def test_accepts_filter(self, authed_client, path, params):
+        """Test that filter parameters are accepted."""
+        response = await authed_client.get(path, params=params)
         assert response.status_code != 422
 
 
@@ -453,74 +238,41 @@ class TestCardOptionalParameters:
     """Tests for optional parameters."""
 
     @pytest.mark.anyio
-    async def test_create_card_with_tags(self, async_client):
-        """Test create card accepts optional tags."""
-        response = await async_client.post(
-            "/flashcards/cards/create",
-            params={
-                "type_name": "Basic",
-                "deck_name": "Test",
-                "front": "Q",
-                "back": "A",
-                "tags": "tag1 tag2"
-            }
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_create_card_with_timezone_offset(self, async_client):
-        """Test create card accepts timezone offset."""
-        response = await async_client.post(
-            "/flashcards/cards/create",
-            params={
-                "type_name": "Basic",
-                "deck_name": "Test",
-                "front": "Q",
-                "back": "A",
-                "user_timezone_offset_minutes": -300
-            }
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_review_card_with_timezone_offset(self, async_client):
-        """Test review card accepts timezone offset."""
-        response = await async_client.post(
-            "/flashcards/cards/review",
-            params={
+    @pytest.mark.parametrize("method,path,params", [
+        pytest.param(
+            "POST", "/flashcards/cards/create",
+            {**CREATE_PARAMS, "tags": "tag1 tag2"}, id="create-tags"
+        ),
+        pytest.param(
+            "POST", "/flashcards/cards/create",
+            {**CREATE_PARAMS, "user_timezone_offset_minutes": -300}, id="create-timezone"
+        ),
+        pytest.param(
+            "POST", "/flashcards/cards/review",
+            {
                 "card_id": 1,
                 "ease": 3,
                 "review_time_ms": 5000,
                 "user_timezone_offset_minutes": 330
-            }
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_update_card_with_only_front(self, async_client):
-        """Test update card with only front field."""
-        response = await async_client.put(
-            "/flashcards/cards/update",
-            params={"card_id": 1, "front": "Updated front"}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_update_card_with_only_back(self, async_client):
-        """Test update card with only back field."""
-        response = await async_client.put(
-            "/flashcards/cards/update",
-            params={"card_id": 1, "back": "Updated back"}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_update_card_with_only_tags(self, async_client):
-        """Test update card with only tags field."""
-        response = await async_client.put(
-            "/flashcards/cards/update",
-            params={"card_id": 1, "tags": "new-tags"}
-        )
+            },
+            id="review-timezone"
+        ),
+        pytest.param(
+            "PUT", "/flashcards/cards/update",
+            {"card_id": 1, "front": "Updated front"}, id="update-only-front"
+        ),
+        pytest.param(
+            "PUT", "/flashcards/cards/update",
+            {"card_id": 1, "back": "Updated back"}, id="update-only-back"
+        ),
+        pytest.param(
+            "PUT", "/flashcards/cards/update",
+            {"card_id": 1, "tags": "new-tags"}, id="update-only-tags"
+        ),
+    ])
+    async def test_accepts_optional_param(self, authed_client, method, path, params):
+        """Test that optional parameters are accepted."""
+        response = await authed_client.request(method, path, params=params)
         assert response.status_code != 422
 
 
@@ -532,84 +284,36 @@ class TestCardEdgeCases:
     """Tests for edge cases in card endpoints."""
 
     @pytest.mark.anyio
-    async def test_list_cards_zero_limit(self, async_client):
-        """Test list cards with limit=0."""
-        response = await async_client.get(
-            "/flashcards/cards/list",
-            params={"limit": 0}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_list_cards_large_limit(self, async_client):
-        """Test list cards with very large limit."""
-        response = await async_client.get(
-            "/flashcards/cards/list",
-            params={"limit": 10000}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_list_cards_large_offset(self, async_client):
-        """Test list cards with very large offset."""
-        response = await async_client.get(
-            "/flashcards/cards/list",
-            params={"offset": 1000000}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_search_cards_empty_query(self, async_client):
-        """Test search cards with empty query string."""
-        response = await async_client.get(
-            "/flashcards/cards/search",
-            params={"query": ""}
-        )
-        # Empty query should be accepted
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_search_cards_special_characters(self, async_client):
-        """Test search cards with special characters in query."""
-        response = await async_client.get(
-            "/flashcards/cards/search",
-            params={"query": "test!@#$%"}
-        )
-        assert response.status_code != 422
-
-    @pytest.mark.anyio
-    async def test_search_cards_unicode_query(self, async_client):
-        """Test search cards with unicode characters."""
-        response = await async_client.get(
-            "/flashcards/cards/search",
-            params={"query": "日本語"}
-        )
+    @pytest.mark.parametrize("method,path,params", [
+        pytest.param("GET", "/flashcards/cards/list", {"limit": 0}, id="zero-limit"),
+        pytest.param("GET", "/flashcards/cards/list", {"limit": 10000}, id="large-limit"),
+        pytest.param("GET", "/flashcards/cards/list", {"offset": 1000000}, id="large-offset"),
+        pytest.param("GET", "/flashcards/cards/search", {"query": ""}, id="empty-query"),
+        pytest.param(
+            "GET", "/flashcards/cards/search", {"query": "test!@#$%"}, id="special-characters"
+        ),
+        pytest.param("GET", "/flashcards/cards/search", {"query": "日本語"}, id="unicode-query"),
+        pytest.param(
+            "POST", "/flashcards/cards/create",
+            {**CREATE_PARAMS, "front": "什么是Python？", "back": "Python是编程语言"},
+            id="unicode-content"
+        ),
+    ])
+    async def test_edge_case_accepted(self, authed_client, method, path, params):
+        """Test that edge-case parameter values pass validation."""
+        response = await authed_client.request(method, path, params=params)
         assert response.status_code != 422
 
     @pytest.mark.anyio
-    async def test_create_card_unicode_content(self, async_client):
-        """Test create card with unicode content."""
-        response = await async_client.post(
-            "/flashcards/cards/create",
-            params={
-                "type_name": "Basic",
-                "deck_name": "Test",
-                "front": "什么是Python？",
-                "back": "Python是编程语言"
-            }
+    @pytest.mark.parametrize("ease", [1, 2, 3, 4])
+    async def test_review_card_ease_value(self, authed_client, ease):
+        """Test review card accepts each valid ease value."""
+        response = await authed_client.post(
+            "/flashcards/cards/review",
+            params={"card_id": 1, "ease": ease, "review_time_ms": 5000}
         )
         assert response.status_code != 422
 
-    @pytest.mark.anyio
-    async def test_review_card_all_ease_values(self, async_client):
-        """Test review card accepts all valid ease values."""
-        for ease in [1, 2, 3, 4]:
-            response = await async_client.post(
-                "/flashcards/cards/review",
-                params={"card_id": 1, "ease": ease, "review_time_ms": 5000}
-            )
-            assert response.status_code != 422
-
 
 # =============================================================================
 # Router Configuration Tests
@@ -618,26 +322,10 @@ class TestCardEdgeCases:
 class TestCardRouterConfiguration:
     """Tests for router configuration and prefixes."""
 
-    @pytest.mark.anyio
-    async def test_flashcards_prefix(self, async_client):
-        """Test that endpoints are under /flashcards prefix."""
-        response = await async_client.get("/flashcards/cards/list")
-        assert response.status_code != 404
-
-    @pytest.mark.anyio
-    async def test_cards_prefix(self, async_client):
-        """Test that card endpoints are under /cards prefix."""
-        response = await async_client.get("/flashcards/cards/list")
-        assert response.status_code != 404
+    def test_router_prefixes(self):
+        """Test that card endpoints are mounted under /flashcards/cards only."""
+        paths = set(app.openapi()["paths"])
 
-    @pytest.mark.anyio
-    async def test_wrong_prefix_returns_404(self, async_client):
-        """Test that wrong prefix returns 404."""
-        response = await async_client.get("/wrong/cards/list")
-        assert response.status_code == 404
-
-    @pytest.mark.anyio
-    async def test_missing_cards_prefix_returns_404(self, async_client):
-        """Test that missing cards prefix returns 404."""
-        response = await async_client.get("/flashcards/list")
-        assert response.status_code == 404
+        assert "/flashcards/cards/list" in paths
+        assert not any(path.startswith("/wrong/") for path in paths)
+        assert "/flashcards/list" not in paths
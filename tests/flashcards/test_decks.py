@@ -5,15 +5,34 @@ Note: Full integration tests require proper database setup.
 """
 import pytest
 
+from app.schemas.flashcards.input.deck import DECK_NAME_MAX_LENGTH
+
+
+# Auth (401/403) or validation (422) may reject an unauthenticated request first
+AUTH_REQUIRED = frozenset({401, 403, 422})
+
+# (method, path, params) for a well-formed request to every deck endpoint
+DECK_ENDPOINTS = [
+    pytest.param("GET", "/flashcards/decks/list", None, id="list"),
+    pytest.param("GET", "/flashcards/decks/get", {"deck_id": 1}, id="get"),
+    pytest.param("POST", "/flashcards/decks/create", {"name": "New Deck"}, id="create"),
+    pytest.param(
+        "PUT", "/flashcards/decks/update",
+        {"deck_id": 1, "name": "Updated"}, id="update"
+    ),
+    pytest.param("DELETE", "/flashcards/decks/delete", {"deck_id": 1}, id="delete"),
+]
+
 
 class TestDeckEndpointsAuthentication:
     """Tests for API authentication on deck endpoints."""
 
     @pytest.mark.anyio
-    async def test_list_decks_without_api_key(self, async_client):
-        """Test that list decks requires API key."""
-        response = await async_client.get("/flashcards/decks/list")
-        assert response.status_code in [401, 403, 422]
+    @pytest.mark.parametrize("method,path,params", DECK_ENDPOINTS)
+    async def test_endpoint_requires_api_key(self, async_client, method, path, params):
+        """Test that each deck endpoint requires an API key."""
+        response = await async_client.request(method, path, params=params)
+        assert response.status_code in AUTH_REQUIRED
 
     @pytest.mark.anyio
     async def test_list_decks_with_invalid_api_key(self, async_client, invalid_api_key_headers):
@@ -24,84 +43,33 @@ class TestDeckEndpointsAuthentication:
         )
         assert response.status_code == 403
 
-    @pytest.mark.anyio
-    async def test_get_deck_without_api_key(self, async_client):
-        """Test that get deck requires API key."""
-        response = await async_client.get(
-            "/flashcards/decks/get",
-            params={"deck_id": 1}
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_create_deck_without_api_key(self, async_client):
-        """Test that create deck requires API key."""
-        response = await async_client.post(
-            "/flashcards/decks/create",
-            params={"name": "New Deck"}
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_update_deck_without_api_key(self, async_client):
-        """Test that update deck requires API key."""
-        response = await async_client.put(
-            "/flashcards/decks/update",
-            params={"deck_id": 1, "name": "Updated"}
-        )
-        assert response.status_code in [401, 403, 422]
-
-    @pytest.mark.anyio
-    async def test_delete_deck_without_api_key(self, async_client):
-        """Test that delete deck requires API key."""
-        response = await async_client.delete(
-            "/flashcards/decks/delete",
-            params={"deck_id": 1}
-        )
-        assert response.status_code in [401, 403, 422]
-
 
 class TestDeckEndpointsExist:
     """Tests that deck endpoints are properly mounted."""
 
     @pytest.mark.anyio
-    async def test_decks_list_endpoint_exists(self, async_client):
-        """Test that decks list endpoint exists."""
-        response = await async_client.get("/flashcards/decks/list")
-        assert response.status_code != 404
-
-    @pytest.mark.anyio
-    async def test_decks_get_endpoint_exists(self, async_client):
-        """Test that decks get endpoint exists."""
-        response = await async_client.get(
-            "/flashcards/decks/get",
-            params={"deck_id": 1}
-        )
+    @pytest.mark.parametrize("method,path,params", DECK_ENDPOINTS)
+    async def test_endpoint_exists(self, async_client, method, path, params):
+        """Test that each deck endpoint exists."""
+        response = await async_client.request(method, path, params=params)
         assert response.status_code != 404
 
-    @pytest.mark.anyio
-    async def test_decks_create_endpoint_exists(self, async_client):
-        """Test that decks create endpoint exists."""
-        response = await async_client.post(
-            "/flashcards/decks/create",
-            params={"name": "Test Deck"}
-        )
-        assert response.status_code != 404
 
-    @pytest.mark.anyio
-    async def test_decks_update_endpoint_exists(self, async_client):
-        """Test that decks update endpoint exists."""
-        response = await async_client.put(
-            "/flashcards/decks/update",
-            params={"deck_id": 1, "name": "Updated"}
-        )
-        assert response.status_code != 404
+class TestDeckNameLength:
+    """Tests for the deck name length limit on the endpoints."""
 
     @pytest.mark.anyio
-    async def test_decks_delete_endpoint_exists(self, async_client):
-        """Test that decks delete endpoint exists."""
-        response = await async_client.delete(
-            "/flashcards/decks/delete",
-            params={"deck_id": 1}
+    @pytest.mark.parametrize("method,path,params", [
+        pytest.param("POST", "/flashcards/decks/create", {}, id="create"),
+        pytest.param("PUT", "/flashcards/decks/update", {"deck_id": 1}, id="update"),
+    ])
+    @pytest.mark.parametrize("length,rejected", [
+        pytest.param(DECK_NAME_MAX_LENGTH, False, id="max"),
+        pytest.param(DECK_NAME_MAX_LENGTH + 1, True, id="too-long"),
+    ])
+    async def test_name_length(self, authed_client, method, path, params, length, rejected):
+        """Test that an oversized deck name is rejected as a validation error."""
+        response = await authed_client.request(
+            method, path, params={**params, "name": "A" * length}
         )
-        assert response.status_code != 404
+        assert (response.status_code == 422) is rejected
@@ -0,0 +1,14 @@
+"""
+Assertion helpers shared by the service tests.
+"""
+from contextlib import contextmanager
+
+import pytest
+
+
+@contextmanager
+def raises_value(message):
+    """Expect a ValueError whose message is exactly ``message``."""
+    with pytest.raises(ValueError) as exc_info:
+        yield exc_info
+    assert str(exc_info.value) == message
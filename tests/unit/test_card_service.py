@@ -2,9 +2,12 @@
 Comprehensive unit tests for the Card Service.
 Tests all card-related CRUD operations, review logic, and search functionality.
 """
+import datetime
+
 import pytest
 from sqlmodel import select
 
+from app.api.routers.flashcards import service as service_module
 from app.api.routers.flashcards.service import Service
 from app.schemas.flashcards.input.card import (
     FlashcardCreateInput,
@@ -15,8 +18,44 @@ from app.schemas.flashcards.input.card import (
     FlashcardReviewInput,
     FlashcardSearchInput
 )
-from app.models.flashcards.card import Card, CardTypeEnum, QueueTypeEnum
+from app.models.flashcards.card import CardTypeEnum, QueueTypeEnum
 from app.models.flashcards.note import Note
+from app.models.flashcards.review_log import RevLog
+from tests.helpers import raises_value
+
+
+pytestmark = pytest.mark.anyio
+
+
+# Constant inputs shared by read-only tests; the service never mutates its input
+LIST_ALL = FlashcardListInput()
+GET_CARD_1 = FlashcardGetInput(card_id=1)
+DELETE_CARD_1 = FlashcardDeleteInput(card_id=1)
+
+# A review time with a millisecond part, for pinning the service clock
+TEST_REVIEW_MS = 1700000000123
+
+# (limit, offset, expected count) over the five seeded cards; None keeps the default
+PAGINATION_CASES = [
+    pytest.param(2, None, 2, id="limit"),
+    pytest.param(2, 3, 2, id="limit-offset"),
+    pytest.param(2, 0, 2, id="page-1"),
+    pytest.param(2, 2, 2, id="page-2"),
+    pytest.param(2, 4, 1, id="page-3"),
+    pytest.param(0, None, 0, id="limit-zero"),
+    pytest.param(None, 1000, 0, id="large-offset"),
+]
+
+LONG_FRONT = "Q" * 5000
+LONG_BACK = "A" * 5000
+
+CREATE_FIELDS = frozenset({
+    "card_id", "note_id", "deck", "front", "back", "tags", "created_at"
+})
+CARD_FIELDS = frozenset({
+    "card_id", "note_id", "deck", "ord", "front", "back", "tags", "type_id",
+    "queue_id", "due", "ivl", "factor", "reps", "lapses", "created_at"
+})
 
 
 # =============================================================================
@@ -26,7 +65,6 @@ from app.models.flashcards.note import Note
 class TestCardCreate:
     """Tests for card creation functionality."""
 
-    @pytest.mark.anyio
     async def test_create_card_success(self, seeded_session):
         """Test successful card creation with valid data."""
         data = FlashcardCreateInput(
@@ -46,7 +84,6 @@ class TestCardCreate:
         assert result.back == "Paris"
         assert "geography europe" in result.tags
 
-    @pytest.mark.anyio
     async def test_create_card_without_tags(self, seeded_session):
         """Test card creation without tags."""
         data = FlashcardCreateInput(
@@ -61,7 +98,6 @@ class TestCardCreate:
         assert result.card_id is not None
         assert result.tags == ""
 
-    @pytest.mark.anyio
     async def test_create_card_with_empty_tags(self, seeded_session):
         """Test card creation with empty string tags."""
         data = FlashcardCreateInput(
@@ -77,8 +113,6 @@ class TestCardCreate:
         assert result.card_id is not None
         assert result.tags == ""
 
-    @pytest.mark.anyio
-    @pytest.mark.skip(reason="SQLite integer overflow with timestamps")
     async def test_create_card_with_multiple_tags(self, seeded_session):
         """Test card creation with multiple space-separated tags."""
         data = FlashcardCreateInput(
@@ -97,34 +131,28 @@ class TestCardCreate:
         assert "important" in result.tags
         assert "review" in result.tags
 
-    @pytest.mark.anyio
-    async def test_create_card_nonexistent_deck(self, seeded_session):
-        """Test card creation with non-existent deck raises error."""
+    @pytest.mark.parametrize("type_name,deck_name,message", [
+        pytest.param(
+            "Basic", "NonExistent Deck", "Deck with name NonExistent Deck not found.",
+            id="nonexistent-deck"
+        ),
+        pytest.param(
+            "NonExistent Type", "Test Deck", "No notetype found for NonExistent Type",
+            id="nonexistent-notetype"
+        ),
+    ])
+    async def test_create_card_missing_reference(self, seeded_session, type_name, deck_name, message):
+        """Test card creation with a non-existent deck or notetype raises error."""
         data = FlashcardCreateInput(
-            type_name="Basic",
-            deck_name="NonExistent Deck",
+            type_name=type_name,
+            deck_name=deck_name,
             front="Question",
             back="Answer"
         )
 
-        with pytest.raises(ValueError, match="Deck with name NonExistent Deck not found"):
+        with raises_value(message):
             await Service.create_card(seeded_session, data)
 
-    @pytest.mark.anyio
-    async def test_create_card_nonexistent_notetype(self, seeded_session):
-        """Test card creation with non-existent notetype raises error."""
-        data = FlashcardCreateInput(
-            type_name="NonExistent Type",
-            deck_name="Test Deck",
-            front="Question",
-            back="Answer"
-        )
-
-        with pytest.raises(ValueError, match="No notetype found"):
-            await Service.create_card(seeded_session, data)
-
-    @pytest.mark.anyio
-    @pytest.mark.skip(reason="SQLite integer overflow with timestamps")
     async def test_create_duplicate_card(self, seeded_session):
         """Test creating duplicate card with same front raises error."""
         data = FlashcardCreateInput(
@@ -145,11 +173,30 @@ class TestCardCreate:
             back="Different Answer"
         )
 
-        with pytest.raises(ValueError, match="Note with same sort field already exists"):
+        with raises_value("Note with same sort field already exists in this notetype."):
             await Service.create_card(seeded_session, data2)
 
-    @pytest.mark.anyio
-    @pytest.mark.skip(reason="SQLite integer overflow with timestamps")
+    async def test_create_cards_sharing_checksum(self, seeded_session, monkeypatch):
+        """Test that different fronts with the same checksum are not duplicates."""
+        monkeypatch.setattr(service_module, "anki_field_checksum", lambda field: 42)
+        data = [
+            FlashcardCreateInput(
+                type_name="Basic",
+                deck_name="Test Deck",
+                front=front,
+                back="Answer"
+            )
+            for front in ("Colliding question one", "Colliding question two")
+        ]
+
+        results = await Service.create_cards(seeded_session, data)
+
+        assert [r.front for r in results] == ["Colliding question one", "Colliding question two"]
+
+        # The same front is still rejected once the checksums match
+        with raises_value("Note with same sort field already exists in this notetype."):
+            await Service.create_card(seeded_session, data[0])
+
     async def test_create_card_with_special_characters(self, seeded_session):
         """Test card creation with special characters in content."""
         data = FlashcardCreateInput(
@@ -165,7 +212,6 @@ class TestCardCreate:
         assert "&" in result.front
         assert "<tags>" in result.back
 
-    @pytest.mark.anyio
     async def test_create_card_with_unicode(self, seeded_session):
         """Test card creation with unicode characters."""
         data = FlashcardCreateInput(
@@ -181,8 +227,6 @@ class TestCardCreate:
         assert "🐍" in result.front
         assert "🎉" in result.back
 
-    @pytest.mark.anyio
-    @pytest.mark.skip(reason="SQLite integer overflow with timestamps")
     async def test_create_card_with_newlines(self, seeded_session):
         """Test card creation with newlines in content."""
         data = FlashcardCreateInput(
@@ -197,17 +241,13 @@ class TestCardCreate:
         assert "\n" in result.front
         assert result.front.count("\n") == 2
 
-    @pytest.mark.anyio
     async def test_create_card_with_long_content(self, seeded_session):
         """Test card creation with very long content."""
-        long_front = "Q" * 5000
-        long_back = "A" * 5000
-
         data = FlashcardCreateInput(
             type_name="Basic",
             deck_name="Test Deck",
-            front=long_front,
-            back=long_back
+            front=LONG_FRONT,
+            back=LONG_BACK
         )
 
         result = await Service.create_card(seeded_session, data)
@@ -215,8 +255,50 @@ class TestCardCreate:
         assert len(result.front) == 5000
         assert len(result.back) == 5000
 
-    @pytest.mark.anyio
-    @pytest.mark.skip(reason="SQLite integer overflow with timestamps")
+    async def test_create_cards_batch(self, seeded_session):
+        """Test creating several cards in one call."""
+        data = [
+            FlashcardCreateInput(
+                type_name="Basic",
+                deck_name="Test Deck",
+                front="Batch question one",
+                back="Batch answer one"
+            ),
+            FlashcardCreateInput(
+                type_name="Basic",
+                deck_name="Test Deck",
+                front="Batch question two",
+                back="Batch answer two",
+                tags="batch"
+            ),
+        ]
+
+        results = await Service.create_cards(seeded_session, data)
+
+        assert [r.front for r in results] == ["Batch question one", "Batch question two"]
+        assert len({r.card_id for r in results}) == 2
+        assert results[1].tags == "batch"
+
+    async def test_create_cards_batch_duplicate_front(self, seeded_session):
+        """Test that a duplicate front within one batch raises error and keeps nothing."""
+        data = [
+            FlashcardCreateInput(
+                type_name="Basic",
+                deck_name="Test Deck",
+                front=front,
+                back="Answer"
+            )
+            for front in ("Batch question one", "Batch question two", "Batch question one")
+        ]
+
+        with raises_value("Note with same sort field already exists in this notetype."):
+            await Service.create_cards(seeded_session, data)
+
+        # A caller that commits after catching the error must not save a partial batch
+        await seeded_session.commit()
+        notes = (await seeded_session.exec(select(Note))).all()
+        assert notes == []
+
     async def test_create_card_returns_correct_output_structure(self, seeded_session):
         """Test that create_card returns all expected fields."""
         data = FlashcardCreateInput(
@@ -230,13 +312,7 @@ class TestCardCreate:
         result = await Service.create_card(seeded_session, data)
 
         # Verify all fields are present
-        assert hasattr(result, 'card_id')
-        assert hasattr(result, 'note_id')
-        assert hasattr(result, 'deck')
-        assert hasattr(result, 'front')
-        assert hasattr(result, 'back')
-        assert hasattr(result, 'tags')
-        assert hasattr(result, 'created_at')
+        assert CREATE_FIELDS <= set(type(result).model_fields)
 
         # Verify types
         assert isinstance(result.card_id, int)
@@ -252,10 +328,9 @@ class TestCardCreate:
 class TestCardGet:
     """Tests for getting individual cards."""
 
-    @pytest.mark.anyio
     async def test_get_card_success(self, seeded_session_with_cards):
         """Test getting an existing card."""
-        data = FlashcardGetInput(card_id=1)
+        data = GET_CARD_1
 
         result = await Service.get_card(seeded_session_with_cards, data)
 
@@ -264,52 +339,35 @@ class TestCardGet:
         assert result.back == "A programming language"
         assert result.deck == "Test Deck"
 
-    @pytest.mark.anyio
-    async def test_get_card_not_found(self, seeded_session):
-        """Test getting non-existent card raises error."""
-        data = FlashcardGetInput(card_id=99999)
+    @pytest.mark.parametrize("card_id", [99999, 0, -1])
+    async def test_get_card_not_found(self, seeded_session, card_id):
+        """Test getting non-existent, zero or negative card ids raises error."""
+        data = FlashcardGetInput(card_id=card_id)
 
-        with pytest.raises(ValueError, match="Card with id 99999 not found"):
+        with raises_value(f"Card with id {card_id} not found"):
             await Service.get_card(seeded_session, data)
 
-    @pytest.mark.anyio
     async def test_get_card_contains_all_fields(self, seeded_session_with_cards):
         """Test that get_card returns all expected fields."""
-        data = FlashcardGetInput(card_id=1)
+        data = GET_CARD_1
 
         result = await Service.get_card(seeded_session_with_cards, data)
 
         # Verify all fields are present
-        assert hasattr(result, 'card_id')
-        assert hasattr(result, 'note_id')
-        assert hasattr(result, 'deck')
-        assert hasattr(result, 'ord')
-        assert hasattr(result, 'front')
-        assert hasattr(result, 'back')
-        assert hasattr(result, 'tags')
-        assert hasattr(result, 'type_id')
-        assert hasattr(result, 'queue_id')
-        assert hasattr(result, 'due')
-        assert hasattr(result, 'ivl')
-        assert hasattr(result, 'factor')
-        assert hasattr(result, 'reps')
-        assert hasattr(result, 'lapses')
-        assert hasattr(result, 'created_at')
-
-    @pytest.mark.anyio
+        assert CARD_FIELDS <= set(type(result).model_fields)
+
     async def test_get_card_returns_correct_tags(self, seeded_session_with_cards):
         """Test that get_card returns correct tags."""
-        data = FlashcardGetInput(card_id=1)
+        data = GET_CARD_1
 
         result = await Service.get_card(seeded_session_with_cards, data)
 
         assert "programming" in result.tags
         assert "python" in result.tags
 
-    @pytest.mark.anyio
     async def test_get_card_returns_scheduling_info(self, seeded_session_with_cards):
         """Test that get_card returns scheduling information."""
-        data = FlashcardGetInput(card_id=1)
+        data = GET_CARD_1
 
         result = await Service.get_card(seeded_session_with_cards, data)
 
@@ -319,29 +377,12 @@ class TestCardGet:
         assert result.reps == 0
         assert result.lapses == 0
 
-    @pytest.mark.anyio
-    async def test_get_multiple_cards_individually(self, seeded_session_with_cards):
-        """Test getting multiple different cards."""
-        for card_id in [1, 2, 3, 4, 5]:
-            data = FlashcardGetInput(card_id=card_id)
-            result = await Service.get_card(seeded_session_with_cards, data)
-            assert result.card_id == card_id
-
-    @pytest.mark.anyio
-    async def test_get_card_with_zero_id(self, seeded_session):
-        """Test getting card with ID 0."""
-        data = FlashcardGetInput(card_id=0)
-
-        with pytest.raises(ValueError, match="Card with id 0 not found"):
-            await Service.get_card(seeded_session, data)
-
-    @pytest.mark.anyio
-    async def test_get_card_with_negative_id(self, seeded_session):
-        """Test getting card with negative ID."""
-        data = FlashcardGetInput(card_id=-1)
-
-        with pytest.raises(ValueError, match="Card with id -1 not found"):
-            await Service.get_card(seeded_session, data)
+    @pytest.mark.parametrize("card_id", [1, 2, 3, 4, 5])
+    async def test_get_multiple_cards_individually(self, seeded_session_with_cards, card_id):
+        """Test getting each of the seeded cards."""
+        data = FlashcardGetInput(card_id=card_id)
+        result = await Service.get_card(seeded_session_with_cards, data)
+        assert result.card_id == card_id
 
 
 # =============================================================================
@@ -351,16 +392,12 @@ class TestCardGet:
 class TestCardList:
     """Tests for listing cards."""
 
-    @pytest.mark.anyio
     async def test_list_all_cards(self, seeded_session_with_cards):
         """Test listing all cards without filters."""
-        data = FlashcardListInput()
-
-        result = await Service.list_cards(seeded_session_with_cards, data)
+        result = await Service.list_cards(seeded_session_with_cards, LIST_ALL)
 
         assert len(result.cards) == 5
 
-    @pytest.mark.anyio
     async def test_list_cards_by_deck_name(self, seeded_session_with_cards):
         """Test filtering cards by deck name."""
         data = FlashcardListInput(deck_name="Test Deck")
@@ -368,9 +405,8 @@ class TestCardList:
         result = await Service.list_cards(seeded_session_with_cards, data)
 
         assert len(result.cards) == 5
-        assert all(card.deck == "Test Deck" for card in result.cards)
+        assert {card.deck for card in result.cards} <= {"Test Deck"}
 
-    @pytest.mark.anyio
     async def test_list_cards_by_type(self, seeded_session_with_cards):
         """Test filtering cards by type_id."""
         data = FlashcardListInput(type_id=CardTypeEnum.NEW.value)
@@ -378,39 +414,18 @@ class TestCardList:
         result = await Service.list_cards(seeded_session_with_cards, data)
 
         assert len(result.cards) == 5
-        assert all(card.type_id == CardTypeEnum.NEW.value for card in result.cards)
-
-    @pytest.mark.anyio
-    async def test_list_cards_pagination_limit(self, seeded_session_with_cards):
-        """Test pagination with limit."""
-        data = FlashcardListInput(limit=2)
-
-        result = await Service.list_cards(seeded_session_with_cards, data)
+        assert {card.type_id for card in result.cards} <= {CardTypeEnum.NEW.value}
 
-        assert len(result.cards) == 2
-
-    @pytest.mark.anyio
-    async def test_list_cards_pagination_offset(self, seeded_session_with_cards):
-        """Test pagination with offset."""
-        data = FlashcardListInput(limit=2, offset=3)
+    @pytest.mark.parametrize("limit,offset,expected", PAGINATION_CASES)
+    async def test_list_cards_pagination(self, seeded_session_with_cards, limit, offset, expected):
+        """Test list pagination over the five seeded cards."""
+        params = {k: v for k, v in (("limit", limit), ("offset", offset)) if v is not None}
+        data = FlashcardListInput(**params)
 
         result = await Service.list_cards(seeded_session_with_cards, data)
 
-        assert len(result.cards) == 2
-
-    @pytest.mark.anyio
-    async def test_list_cards_pagination_all_pages(self, seeded_session_with_cards):
-        """Test pagination covers all cards."""
-        all_cards = []
-        for offset in range(0, 5, 2):
-            data = FlashcardListInput(limit=2, offset=offset)
-            result = await Service.list_cards(seeded_session_with_cards, data)
-            all_cards.extend(result.cards)
+        assert len(result.cards) == expected
 
-        # Should get all 5 cards (2 + 2 + 1)
-        assert len(all_cards) == 5
-
-    @pytest.mark.anyio
     async def test_list_cards_nonexistent_deck(self, seeded_session_with_cards):
         """Test listing cards from non-existent deck returns empty list."""
         data = FlashcardListInput(deck_name="NonExistent Deck")
@@ -419,34 +434,14 @@ class TestCardList:
 
         assert len(result.cards) == 0
 
-    @pytest.mark.anyio
     async def test_list_cards_empty_database(self, seeded_session):
         """Test listing cards when no cards exist."""
-        data = FlashcardListInput()
+        data = LIST_ALL
 
         result = await Service.list_cards(seeded_session, data)
 
         assert len(result.cards) == 0
 
-    @pytest.mark.anyio
-    async def test_list_cards_with_limit_zero(self, seeded_session_with_cards):
-        """Test listing with limit=0."""
-        data = FlashcardListInput(limit=0)
-
-        result = await Service.list_cards(seeded_session_with_cards, data)
-
-        assert len(result.cards) == 0
-
-    @pytest.mark.anyio
-    async def test_list_cards_with_large_offset(self, seeded_session_with_cards):
-        """Test listing with offset larger than total cards."""
-        data = FlashcardListInput(offset=1000)
-
-        result = await Service.list_cards(seeded_session_with_cards, data)
-
-        assert len(result.cards) == 0
-
-    @pytest.mark.anyio
     async def test_list_cards_returns_correct_structure(self, seeded_session_with_cards):
         """Test that list returns cards with correct structure."""
         data = FlashcardListInput(limit=1)
@@ -457,16 +452,8 @@ class TestCardList:
         card = result.cards[0]
 
         # Check all fields
-        assert hasattr(card, 'card_id')
-        assert hasattr(card, 'note_id')
-        assert hasattr(card, 'deck')
-        assert hasattr(card, 'front')
-        assert hasattr(card, 'back')
-        assert hasattr(card, 'tags')
-        assert hasattr(card, 'type_id')
-        assert hasattr(card, 'queue_id')
-
-    @pytest.mark.anyio
+        assert CARD_FIELDS <= set(type(card).model_fields)
+
     async def test_list_cards_combined_filters(self, seeded_session_with_cards):
         """Test listing with multiple filters."""
         data = FlashcardListInput(
@@ -478,8 +465,8 @@ class TestCardList:
         result = await Service.list_cards(seeded_session_with_cards, data)
 
         assert len(result.cards) <= 3
-        assert all(card.deck == "Test Deck" for card in result.cards)
-        assert all(card.type_id == CardTypeEnum.NEW.value for card in result.cards)
+        assert {card.deck for card in result.cards} <= {"Test Deck"}
+        assert {card.type_id for card in result.cards} <= {CardTypeEnum.NEW.value}
 
 
 # =============================================================================
@@ -489,7 +476,6 @@ class TestCardList:
 class TestCardUpdate:
     """Tests for updating cards."""
 
-    @pytest.mark.anyio
     async def test_update_card_front(self, seeded_session_with_cards):
         """Test updating card front text."""
         data = FlashcardUpdateInput(
@@ -504,7 +490,6 @@ class TestCardUpdate:
         assert result.back == "A programming language"  # Unchanged
         assert "updated successfully" in result.message.lower()
 
-    @pytest.mark.anyio
     async def test_update_card_multiple_fields(self, seeded_session_with_cards):
         """Test updating multiple fields at once."""
         data = FlashcardUpdateInput(
@@ -520,7 +505,6 @@ class TestCardUpdate:
         assert result.back == "New Back"
         assert result.tags == "new-tags"
 
-    @pytest.mark.anyio
     async def test_update_card_not_found(self, seeded_session):
         """Test updating non-existent card raises error."""
         data = FlashcardUpdateInput(
@@ -528,19 +512,16 @@ class TestCardUpdate:
             front="Updated"
         )
 
-        with pytest.raises(ValueError, match="Card with id 99999 not found"):
+        with raises_value("Card with id 99999 not found"):
             await Service.update_card(seeded_session, data)
 
-    @pytest.mark.anyio
     async def test_update_card_no_fields(self, seeded_session_with_cards):
         """Test updating without any fields raises error."""
         data = FlashcardUpdateInput(card_id=1)
 
-        with pytest.raises(ValueError, match="At least one field"):
+        with raises_value("At least one field (front, back, or tags) must be provided for update"):
             await Service.update_card(seeded_session_with_cards, data)
 
-    @pytest.mark.anyio
-    @pytest.mark.skip(reason="SQLite integer overflow with timestamps")
     async def test_update_card_preserves_unchanged_fields(self, seeded_session_with_cards):
         """Test that unchanged fields are preserved."""
         # Get original
@@ -556,8 +537,6 @@ class TestCardUpdate:
         assert result.front == "Only Front Changed"
         assert result.back == original.back  # Preserved
 
-    @pytest.mark.anyio
-    @pytest.mark.skip(reason="SQLite integer overflow with timestamps")
     async def test_update_card_with_empty_tags(self, seeded_session_with_cards):
         """Test updating card with empty tags."""
         data = FlashcardUpdateInput(
@@ -569,7 +548,6 @@ class TestCardUpdate:
 
         assert result.tags == ""
 
-    @pytest.mark.anyio
     async def test_update_card_returns_updated_at(self, seeded_session_with_cards):
         """Test that update returns updated_at timestamp."""
         data = FlashcardUpdateInput(
@@ -591,23 +569,13 @@ class TestCardUpdate:
 class TestCardDelete:
     """Tests for deleting cards."""
 
-    @pytest.mark.anyio
     async def test_delete_card_success(self, seeded_session_with_cards):
         """Test successful card deletion."""
-        data = FlashcardDeleteInput(card_id=1)
-
-        result = await Service.delete_card(seeded_session_with_cards, data)
+        result = await Service.delete_card(seeded_session_with_cards, DELETE_CARD_1)
 
         assert result.card_id == 1
         assert "deleted successfully" in result.message.lower()
 
-        # Verify card is actually deleted
-        card = (await seeded_session_with_cards.exec(
-            select(Card).where(Card.id == 1)
-        )).first()
-        assert card is None
-
-    @pytest.mark.anyio
     async def test_delete_card_also_deletes_orphan_note(self, seeded_session_with_cards):
         """Test that deleting the only card of a note also deletes the note."""
         data = FlashcardDeleteInput(card_id=2)
@@ -616,20 +584,15 @@ class TestCardDelete:
         await Service.delete_card(seeded_session_with_cards, data)
 
         # Verify note is also deleted
-        note = (await seeded_session_with_cards.exec(
-            select(Note).where(Note.id == note_id)
-        )).first()
-        assert note is None
+        assert await seeded_session_with_cards.get(Note, note_id) is None
 
-    @pytest.mark.anyio
     async def test_delete_card_not_found(self, seeded_session):
         """Test deleting non-existent card raises error."""
         data = FlashcardDeleteInput(card_id=99999)
 
-        with pytest.raises(ValueError, match="Card with id 99999 not found"):
+        with raises_value("Card with id 99999 not found"):
             await Service.delete_card(seeded_session, data)
 
-    @pytest.mark.anyio
     async def test_delete_card_returns_note_id(self, seeded_session_with_cards):
         """Test that delete returns the note_id."""
         data = FlashcardDeleteInput(card_id=3)
@@ -639,7 +602,6 @@ class TestCardDelete:
         assert result.note_id is not None
         assert isinstance(result.note_id, int)
 
-    @pytest.mark.anyio
     async def test_delete_card_returns_deleted_at(self, seeded_session_with_cards):
         """Test that delete returns deleted_at timestamp."""
         data = FlashcardDeleteInput(card_id=4)
@@ -649,18 +611,23 @@ class TestCardDelete:
         assert result.deleted_at is not None
         assert isinstance(result.deleted_at, int)
 
-    @pytest.mark.anyio
+    @pytest.mark.parametrize("card_id", [1, 2, 3])
+    async def test_delete_card_by_id(self, seeded_session_with_cards, card_id):
+        """Test deleting each card returns its id."""
+        data = FlashcardDeleteInput(card_id=card_id)
+        result = await Service.delete_card(seeded_session_with_cards, data)
+        assert result.card_id == card_id
+
     async def test_delete_multiple_cards(self, seeded_session_with_cards):
         """Test deleting multiple cards sequentially."""
         for card_id in [1, 2, 3]:
             data = FlashcardDeleteInput(card_id=card_id)
-            result = await Service.delete_card(seeded_session_with_cards, data)
-            assert result.card_id == card_id
+            await Service.delete_card(seeded_session_with_cards, data)
 
         # Verify remaining cards
         remaining = await Service.list_cards(
             seeded_session_with_cards,
-            FlashcardListInput()
+            LIST_ALL
         )
         assert len(remaining.cards) == 2
 
@@ -672,7 +639,6 @@ class TestCardDelete:
 class TestCardReview:
     """Tests for card review functionality (spaced repetition logic)."""
 
-    @pytest.mark.anyio
     async def test_review_new_card_transitions_to_learning(self, seeded_session_with_cards):
         """Test that reviewing a new card transitions it to learning."""
         data = FlashcardReviewInput(
@@ -688,16 +654,14 @@ class TestCardReview:
         assert result.queue_id == QueueTypeEnum.LEARNING.value
         assert result.reps == 1
 
-    @pytest.mark.anyio
-    async def test_review_learning_card_transitions_to_review(self, seeded_session_with_cards):
+    async def test_review_learning_card_transitions_to_review(self, seeded_session_with_cards, put_card):
         """Test that reviewing a learning card transitions it to review."""
         # First, make the card a learning card
-        card = (await seeded_session_with_cards.exec(
-            select(Card).where(Card.id == 2)
-        )).first()
-        card.type_id = CardTypeEnum.LEARNING.value
-        card.queue_id = QueueTypeEnum.LEARNING.value
-        await seeded_session_with_cards.commit()
+        await put_card(
+            seeded_session_with_cards, 2,
+            type_id=CardTypeEnum.LEARNING.value,
+            queue_id=QueueTypeEnum.LEARNING.value
+        )
 
         data = FlashcardReviewInput(
             card_id=2,
@@ -711,98 +675,113 @@ class TestCardReview:
         assert result.queue_id == QueueTypeEnum.REVIEW.value
         assert result.new_ivl == 1
 
-    @pytest.mark.anyio
-    async def test_review_card_ease_again_increases_lapses(self, seeded_session_with_cards):
-        """Test that reviewing with ease=1 (Again) increases lapses."""
-        # Make card a review card
-        card = (await seeded_session_with_cards.exec(
-            select(Card).where(Card.id == 3)
-        )).first()
-        card.type_id = CardTypeEnum.REVIEW.value
-        card.queue_id = QueueTypeEnum.REVIEW.value
-        card.ivl = 10
-        await seeded_session_with_cards.commit()
+    @pytest.mark.parametrize(
+        "card_id,ivl,factor,ease,attr,expected",
+        [
+            pytest.param(3, 10, 2500, 1, "lapses", 1, id="again-increases-lapses"),
+            pytest.param(3, 10, 2500, 1, "new_ivl", 1, id="again-resets-interval"),
+            pytest.param(4, 10, 2500, 2, "new_factor", 2350, id="hard-decreases-factor"),
+            # ivl * factor / 1000 = 10 * 2500 / 1000 = 25
+            pytest.param(5, 10, 2500, 3, "new_ivl", 25, id="good-normal-progression"),
+            # ivl * factor / 1000 * 1.3 = 10 * 2500 / 1000 * 1.3 = 32
+            pytest.param(1, 10, 2500, 4, "new_ivl", 32, id="easy-bonus"),
+            pytest.param(3, 10, 1300, 1, "new_factor", 1300, id="factor-minimum"),
+        ],
+    )
+    async def test_review_card_ease(
+        self, seeded_session_with_cards, put_card,
+        card_id, ivl, factor, ease, attr, expected
+    ):
+        """Test the outcome of reviewing a review card with each ease value."""
+        await put_card(
+            seeded_session_with_cards, card_id,
+            type_id=CardTypeEnum.REVIEW.value,
+            queue_id=QueueTypeEnum.REVIEW.value,
+            ivl=ivl,
+            factor=factor
+        )
 
         data = FlashcardReviewInput(
-            card_id=3,
-            ease=1,  # Again
+            card_id=card_id,
+            ease=ease,
             review_time_ms=5000
         )
 
         result = await Service.review_card(seeded_session_with_cards, data)
 
-        assert result.lapses == 1
-        assert result.new_ivl == 1  # Reset to 1 day
-
-    @pytest.mark.anyio
-    async def test_review_card_ease_hard_decreases_factor(self, seeded_session_with_cards):
-        """Test that reviewing with ease=2 (Hard) decreases factor."""
-        card = (await seeded_session_with_cards.exec(
-            select(Card).where(Card.id == 4)
-        )).first()
-        card.type_id = CardTypeEnum.REVIEW.value
-        card.queue_id = QueueTypeEnum.REVIEW.value
-        card.ivl = 10
-        card.factor = 2500
-        await seeded_session_with_cards.commit()
+        assert getattr(result, attr) == expected
 
-        data = FlashcardReviewInput(
-            card_id=4,
-            ease=2,  # Hard
-            review_time_ms=5000
-        )
+    async def test_review_cards_batch(self, seeded_session_with_cards):
+        """Test reviewing several cards in one call."""
+        data = [
+            FlashcardReviewInput(card_id=card_id, ease=3, review_time_ms=5000)
+            for card_id in (1, 2, 3, 4, 5)
+        ]
 
-        result = await Service.review_card(seeded_session_with_cards, data)
+        results = await Service.review_cards(seeded_session_with_cards, data)
 
-        assert result.new_factor == 2350  # 2500 - 150
+        assert [r.card_id for r in results] == [1, 2, 3, 4, 5]
+        assert {r.type_id for r in results} == {CardTypeEnum.LEARNING.value}
+        assert len({r.revlog_id for r in results}) == 5
 
-    @pytest.mark.anyio
-    async def test_review_card_ease_good_normal_progression(self, seeded_session_with_cards):
-        """Test that reviewing with ease=3 (Good) follows normal progression."""
-        card = (await seeded_session_with_cards.exec(
-            select(Card).where(Card.id == 5)
-        )).first()
-        card.type_id = CardTypeEnum.REVIEW.value
-        card.queue_id = QueueTypeEnum.REVIEW.value
-        card.ivl = 10
-        card.factor = 2500
-        await seeded_session_with_cards.commit()
+    async def test_review_cards_empty_batch(self, seeded_session_with_cards):
+        """Test that an empty batch reviews nothing."""
+        results = await Service.review_cards(seeded_session_with_cards, [])
 
-        data = FlashcardReviewInput(
-            card_id=5,
-            ease=3,  # Good
-            review_time_ms=5000
+        assert results == []
+
+    async def test_review_cards_batch_card_not_found(self, seeded_session_with_cards):
+        """Test that a missing card in a batch raises error."""
+        data = [
+            FlashcardReviewInput(card_id=card_id, ease=3, review_time_ms=5000)
+            for card_id in (1, 99999)
+        ]
+
+        with raises_value("Card not found"):
+            await Service.review_cards(seeded_session_with_cards, data)
+
+    async def _take_revlog_ids(self, session, revlog_ids):
+        session.add_all(
+            RevLog(id=revlog_id, cid=5, usn=0, ease=3, ivl=0, lastIvl=0,
+                   factor=2500, time=1000, type=0)
+            for revlog_id in revlog_ids
         )
+        await session.commit()
 
+    async def test_review_revlog_id_taken(self, seeded_session_with_cards, monkeypatch):
+        """Test that a review whose revlog id is taken retries past the max id."""
+        reviewed_at = datetime.datetime.fromtimestamp(TEST_REVIEW_MS / 1000, datetime.timezone.utc)
+        monkeypatch.setattr(service_module, "get_user_localtime", lambda *args, **kwargs: reviewed_at)
+        await self._take_revlog_ids(seeded_session_with_cards, [TEST_REVIEW_MS])
+
+        data = FlashcardReviewInput(card_id=1, ease=3, review_time_ms=5000)
         result = await Service.review_card(seeded_session_with_cards, data)
 
-        # ivl * factor / 1000 = 10 * 2500 / 1000 = 25
-        assert result.new_ivl == 25
-
-    @pytest.mark.anyio
-    async def test_review_card_ease_easy_bonus(self, seeded_session_with_cards):
-        """Test that reviewing with ease=4 (Easy) gives bonus interval."""
-        card = (await seeded_session_with_cards.exec(
-            select(Card).where(Card.id == 1)
-        )).first()
-        card.type_id = CardTypeEnum.REVIEW.value
-        card.queue_id = QueueTypeEnum.REVIEW.value
-        card.ivl = 10
-        card.factor = 2500
-        await seeded_session_with_cards.commit()
+        assert result.revlog_id == TEST_REVIEW_MS + 1
+        assert result.reviewed_at == TEST_REVIEW_MS // 1000
+        assert result.reps == 1
 
-        data = FlashcardReviewInput(
-            card_id=1,
-            ease=4,  # Easy
-            review_time_ms=5000
-        )
+    async def test_review_revlog_id_retries_stale_max(self, seeded_session_with_cards, monkeypatch):
+        """Test that a retry whose max id went stale retries again."""
+        reviewed_at = datetime.datetime.fromtimestamp(TEST_REVIEW_MS / 1000, datetime.timezone.utc)
+        monkeypatch.setattr(service_module, "get_user_localtime", lambda *args, **kwargs: reviewed_at)
+        await self._take_revlog_ids(seeded_session_with_cards, [TEST_REVIEW_MS, TEST_REVIEW_MS + 1])
+
+        # The first lookup misses the id a concurrent review took meanwhile
+        last_revlog_ids = iter([TEST_REVIEW_MS])
+        real_last_revlog_id = Service._last_revlog_id
+
+        async def stale_last_revlog_id(session):
+            return next(last_revlog_ids, None) or await real_last_revlog_id(session)
 
+        monkeypatch.setattr(Service, "_last_revlog_id", staticmethod(stale_last_revlog_id))
+
+        data = FlashcardReviewInput(card_id=1, ease=3, review_time_ms=5000)
         result = await Service.review_card(seeded_session_with_cards, data)
 
-        # ivl * factor / 1000 * 1.3 = 10 * 2500 / 1000 * 1.3 = 32
-        assert result.new_ivl == 32
+        assert result.revlog_id == TEST_REVIEW_MS + 2
+        assert result.reps == 1
 
-    @pytest.mark.anyio
     async def test_review_card_not_found(self, seeded_session):
         """Test reviewing non-existent card raises error."""
         data = FlashcardReviewInput(
@@ -811,10 +790,9 @@ class TestCardReview:
             review_time_ms=5000
         )
 
-        with pytest.raises(ValueError, match="Card not found"):
+        with raises_value("Card not found"):
             await Service.review_card(seeded_session, data)
 
-    @pytest.mark.anyio
     async def test_review_creates_revlog_entry(self, seeded_session_with_cards):
         """Test that review creates a review log entry."""
         data = FlashcardReviewInput(
@@ -827,29 +805,6 @@ class TestCardReview:
 
         assert result.revlog_id is not None
 
-    @pytest.mark.anyio
-    async def test_review_factor_has_minimum(self, seeded_session_with_cards):
-        """Test that factor never goes below minimum (1300)."""
-        card = (await seeded_session_with_cards.exec(
-            select(Card).where(Card.id == 3)
-        )).first()
-        card.type_id = CardTypeEnum.REVIEW.value
-        card.queue_id = QueueTypeEnum.REVIEW.value
-        card.ivl = 10
-        card.factor = 1300  # Already at minimum
-        await seeded_session_with_cards.commit()
-
-        data = FlashcardReviewInput(
-            card_id=3,
-            ease=1,  # Again - would normally decrease factor by 200
-            review_time_ms=5000
-        )
-
-        result = await Service.review_card(seeded_session_with_cards, data)
-
-        assert result.new_factor == 1300  # Stays at minimum
-
-    @pytest.mark.anyio
     async def test_review_increments_reps(self, seeded_session_with_cards):
         """Test that each review increments reps counter."""
         data = FlashcardReviewInput(
@@ -861,7 +816,6 @@ class TestCardReview:
         result = await Service.review_card(seeded_session_with_cards, data)
         assert result.reps == 1
 
-    @pytest.mark.anyio
     async def test_review_returns_reviewed_at(self, seeded_session_with_cards):
         """Test that review returns reviewed_at timestamp."""
         data = FlashcardReviewInput(
@@ -875,28 +829,18 @@ class TestCardReview:
         assert result.reviewed_at is not None
         assert isinstance(result.reviewed_at, int)
 
-    @pytest.mark.anyio
-    @pytest.mark.skip(reason="SQLite integer overflow with timestamps")
-    async def test_review_all_ease_values(self, seeded_session_with_cards):
-        """Test reviewing with all valid ease values."""
-        for ease in [1, 2, 3, 4]:
-            # Reset card for each test
-            card = (await seeded_session_with_cards.exec(
-                select(Card).where(Card.id == 1)
-            )).first()
-            card.type_id = CardTypeEnum.NEW.value
-            card.queue_id = QueueTypeEnum.NEW.value
-            card.reps = 0
-            await seeded_session_with_cards.commit()
-
-            data = FlashcardReviewInput(
-                card_id=1,
-                ease=ease,
-                review_time_ms=5000
-            )
+    @pytest.mark.parametrize("ease", [1, 2, 3, 4])
+    async def test_review_all_ease_values(self, seeded_session_with_cards, ease):
+        """Test reviewing a new card with each valid ease value."""
+        data = FlashcardReviewInput(
+            card_id=1,
+            ease=ease,
+            review_time_ms=5000
+        )
 
-            result = await Service.review_card(seeded_session_with_cards, data)
-            assert result.reps == 1
+        result = await Service.review_card(seeded_session_with_cards, data)
+
+        assert result.reps == 1
 
 
 # =============================================================================
@@ -906,7 +850,6 @@ class TestCardReview:
 class TestCardSearch:
     """Tests for card search functionality."""
 
-    @pytest.mark.anyio
     async def test_search_cards_by_content(self, seeded_session_with_cards):
         """Test searching cards by content."""
         data = FlashcardSearchInput(query="Python")
@@ -914,20 +857,30 @@ class TestCardSearch:
         result = await Service.search_cards(seeded_session_with_cards, data)
 
         # Should find cards mentioning Python
-        assert len(result.cards) >= 1
-        assert any("Python" in card.front or "Python" in card.back
-                   for card in result.cards)
-
-    @pytest.mark.anyio
-    async def test_search_cards_case_insensitive(self, seeded_session_with_cards):
-        """Test that search is case insensitive."""
-        data = FlashcardSearchInput(query="python")
+        assert "What is Python?" in {card.front for card in result.cards}
+
+    @pytest.mark.parametrize(
+        "query,min_results,max_results",
+        [
+            pytest.param("python", 1, 5, id="case-insensitive"),
+            pytest.param("Pyth", 1, 5, id="partial-match"),
+            pytest.param("programming language", 1, 5, id="in-back"),
+            pytest.param("?", 1, 5, id="special-characters"),
+            # Empty query should match all cards
+            pytest.param("", 5, 5, id="empty-query"),
+            pytest.param("xyznonexistent123", 0, 0, id="no-results"),
+        ],
+    )
+    async def test_search_cards_query(
+        self, seeded_session_with_cards, query, min_results, max_results
+    ):
+        """Test how many of the 5 seeded cards a search query matches."""
+        data = FlashcardSearchInput(query=query)
 
         result = await Service.search_cards(seeded_session_with_cards, data)
 
-        assert len(result.cards) >= 1
+        assert min_results <= len(result.cards) <= max_results
 
-    @pytest.mark.anyio
     async def test_search_cards_with_deck_filter(self, seeded_session_with_cards):
         """Test searching with deck filter."""
         data = FlashcardSearchInput(
@@ -937,9 +890,8 @@ class TestCardSearch:
 
         result = await Service.search_cards(seeded_session_with_cards, data)
 
-        assert all(card.deck == "Test Deck" for card in result.cards)
+        assert {card.deck for card in result.cards} <= {"Test Deck"}
 
-    @pytest.mark.anyio
     async def test_search_cards_with_tags_filter(self, seeded_session_with_cards):
         """Test searching with tags filter."""
         data = FlashcardSearchInput(
@@ -949,31 +901,30 @@ class TestCardSearch:
 
         result = await Service.search_cards(seeded_session_with_cards, data)
 
-        assert len(result.cards) >= 1
-        assert any("testing" in card.tags for card in result.cards)
+        assert "What is pytest?" in {card.front for card in result.cards}
 
-    @pytest.mark.anyio
-    async def test_search_cards_with_type_filter(self, seeded_session_with_cards):
-        """Test searching with type filter."""
+    async def test_search_cards_tags_filter_matches_whole_tags(self, seeded_session_with_cards):
+        """Test that the tags filter does not match part of a tag."""
         data = FlashcardSearchInput(
             query="What",
-            type_id=CardTypeEnum.NEW.value
+            tags="test"
         )
 
         result = await Service.search_cards(seeded_session_with_cards, data)
 
-        assert all(card.type_id == CardTypeEnum.NEW.value for card in result.cards)
+        assert len(result.cards) == 0
 
-    @pytest.mark.anyio
-    async def test_search_cards_no_results(self, seeded_session_with_cards):
-        """Test search with no matching results."""
-        data = FlashcardSearchInput(query="xyznonexistent123")
+    async def test_search_cards_with_type_filter(self, seeded_session_with_cards):
+        """Test searching with type filter."""
+        data = FlashcardSearchInput(
+            query="What",
+            type_id=CardTypeEnum.NEW.value
+        )
 
         result = await Service.search_cards(seeded_session_with_cards, data)
 
-        assert len(result.cards) == 0
+        assert {card.type_id for card in result.cards} <= {CardTypeEnum.NEW.value}
 
-    @pytest.mark.anyio
     async def test_search_cards_pagination(self, seeded_session_with_cards):
         """Test search pagination."""
         data = FlashcardSearchInput(
@@ -986,25 +937,6 @@ class TestCardSearch:
 
         assert len(result.cards) <= 2
 
-    @pytest.mark.anyio
-    async def test_search_cards_partial_match(self, seeded_session_with_cards):
-        """Test partial string matching in search."""
-        data = FlashcardSearchInput(query="Pyth")  # Partial match for Python
-
-        result = await Service.search_cards(seeded_session_with_cards, data)
-
-        assert len(result.cards) >= 1
-
-    @pytest.mark.anyio
-    async def test_search_cards_in_back(self, seeded_session_with_cards):
-        """Test searching in card back content."""
-        data = FlashcardSearchInput(query="programming language")
-
-        result = await Service.search_cards(seeded_session_with_cards, data)
-
-        assert len(result.cards) >= 1
-
-    @pytest.mark.anyio
     async def test_search_cards_combined_filters(self, seeded_session_with_cards):
         """Test search with multiple filters combined."""
         data = FlashcardSearchInput(
@@ -1016,11 +948,9 @@ class TestCardSearch:
 
         result = await Service.search_cards(seeded_session_with_cards, data)
 
-        for card in result.cards:
-            assert card.deck == "Test Deck"
-            assert card.type_id == CardTypeEnum.NEW.value
+        assert {card.deck for card in result.cards} <= {"Test Deck"}
+        assert {card.type_id for card in result.cards} <= {CardTypeEnum.NEW.value}
 
-    @pytest.mark.anyio
     async def test_search_cards_returns_correct_structure(self, seeded_session_with_cards):
         """Test that search returns cards with correct structure."""
         data = FlashcardSearchInput(query="What", limit=1)
@@ -1029,28 +959,4 @@ class TestCardSearch:
 
         if len(result.cards) > 0:
             card = result.cards[0]
-            assert hasattr(card, 'card_id')
-            assert hasattr(card, 'front')
-            assert hasattr(card, 'back')
-            assert hasattr(card, 'tags')
-            assert hasattr(card, 'deck')
-
-    @pytest.mark.anyio
-    async def test_search_cards_empty_query(self, seeded_session_with_cards):
-        """Test search with empty query string."""
-        data = FlashcardSearchInput(query="")
-
-        result = await Service.search_cards(seeded_session_with_cards, data)
-
-        # Empty query should match all cards
-        assert len(result.cards) == 5
-
-    @pytest.mark.anyio
-    async def test_search_cards_special_characters(self, seeded_session_with_cards):
-        """Test search with special characters."""
-        data = FlashcardSearchInput(query="?")
-
-        result = await Service.search_cards(seeded_session_with_cards, data)
-
-        # Should find cards with question marks
-        assert len(result.cards) >= 1
+            assert CARD_FIELDS <= set(type(card).model_fields)
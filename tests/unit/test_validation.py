@@ -22,24 +22,52 @@ from app.schemas.flashcards.input.deck import (
 )
 
 
+pytestmark = pytest.mark.no_db
+
+LONG_STRING = "A" * 10000
+
+# Valid FlashcardCreateInput payloads that must pass through unchanged;
+# escaping and trimming are handled elsewhere
+CREATE_INPUT_CASES = [
+    pytest.param({
+        "type_name": "Basic", "deck_name": "Test Deck",
+        "front": "Question", "back": "Answer", "tags": "tag1 tag2"
+    }, id="all-fields"),
+    pytest.param({
+        "type_name": "Basic", "deck_name": "Test", "front": "", "back": ""
+    }, id="empty-strings"),
+    pytest.param({
+        "type_name": "Basic", "deck_name": "Test",
+        "front": LONG_STRING, "back": LONG_STRING
+    }, id="long-strings"),
+    pytest.param({
+        "type_name": "Basic", "deck_name": "日本語",
+        "front": "什么是Python？", "back": "Python是一种编程语言 🐍"
+    }, id="unicode"),
+    pytest.param({
+        "type_name": "Basic", "deck_name": "Deck::SubDeck",
+        "front": "<script>alert('xss')</script>", "back": "'\"\\n\\t"
+    }, id="special-characters"),
+    pytest.param({
+        "type_name": "  Basic  ", "deck_name": "  Test Deck  ",
+        "front": "  Question with spaces  ", "back": "  Answer with spaces  "
+    }, id="whitespace"),
+    pytest.param({
+        "type_name": "Basic", "deck_name": "Test",
+        "front": "Line 1\nLine 2\nLine 3", "back": "Answer\nWith\nNewlines"
+    }, id="newlines"),
+]
+
+
 class TestCardInputValidation:
     """Tests for card input schema validation."""
 
-    def test_flashcard_create_input_valid(self):
-        """Test valid FlashcardCreateInput."""
-        data = FlashcardCreateInput(
-            type_name="Basic",
-            deck_name="Test Deck",
-            front="Question",
-            back="Answer",
-            tags="tag1 tag2"
-        )
+    @pytest.mark.parametrize("fields", CREATE_INPUT_CASES)
+    def test_flashcard_create_input_valid(self, fields):
+        """Test valid FlashcardCreateInput keeps every field as given."""
+        data = FlashcardCreateInput(**fields)
         
-        assert data.type_name == "Basic"
-        assert data.deck_name == "Test Deck"
-        assert data.front == "Question"
-        assert data.back == "Answer"
-        assert data.tags == "tag1 tag2"
+        assert data.model_dump(include=set(fields)) == fields
 
     def test_flashcard_create_input_minimal(self):
         """Test FlashcardCreateInput with only required fields."""
@@ -110,12 +138,17 @@ class TestCardInputValidation:
         assert data.limit == 100
         assert data.offset == 0
 
-    def test_flashcard_list_input_custom_pagination(self):
+    @pytest.mark.parametrize("limit,offset", [
+        pytest.param(50, 25, id="custom"),
+        pytest.param(0, 0, id="zero"),
+        pytest.param(1000000, 1000000, id="large"),
+    ])
+    def test_flashcard_list_input_custom_pagination(self, limit, offset):
         """Test FlashcardListInput with custom pagination."""
-        data = FlashcardListInput(limit=50, offset=25)
+        data = FlashcardListInput(limit=limit, offset=offset)
         
-        assert data.limit == 50
-        assert data.offset == 25
+        assert data.limit == limit
+        assert data.offset == offset
 
     def test_flashcard_review_input_valid(self):
         """Test valid FlashcardReviewInput."""
@@ -129,15 +162,15 @@ class TestCardInputValidation:
         assert data.ease == 3
         assert data.review_time_ms == 5000
 
-    def test_flashcard_review_input_all_ease_values(self):
+    @pytest.mark.parametrize("ease", [1, 2, 3, 4])
+    def test_flashcard_review_input_all_ease_values(self, ease):
         """Test FlashcardReviewInput with all valid ease values."""
-        for ease in [1, 2, 3, 4]:
-            data = FlashcardReviewInput(
-                card_id=1,
-                ease=ease,
-                review_time_ms=5000
-            )
-            assert data.ease == ease
+        data = FlashcardReviewInput(
+            card_id=1,
+            ease=ease,
+            review_time_ms=5000
+        )
+        assert data.ease == ease
 
     def test_flashcard_search_input_valid(self):
         """Test valid FlashcardSearchInput."""
@@ -178,6 +211,11 @@ class TestDeckInputValidation:
         with pytest.raises(ValidationError):
             DeckCreateInput()
 
+    def test_deck_create_input_name_too_long(self):
+        """Test DeckCreateInput with a name over 2048 characters raises error."""
+        with pytest.raises(ValidationError):
+            DeckCreateInput(name=LONG_STRING)
+
     def test_deck_get_input_valid(self):
         """Test valid DeckGetInput."""
         data = DeckGetInput(deck_id=1)
@@ -204,6 +242,11 @@ class TestDeckInputValidation:
         assert data.new_name is None
         assert data.config_id is None
 
+    def test_deck_update_input_name_too_long(self):
+        """Test DeckUpdateInput with a new name over 2048 characters raises error."""
+        with pytest.raises(ValidationError):
+            DeckUpdateInput(deck_id=1, new_name=LONG_STRING)
+
     def test_deck_delete_input_valid(self):
         """Test valid DeckDeleteInput."""
         data = DeckDeleteInput(deck_id=1)
@@ -221,98 +264,6 @@ class TestDeckInputValidation:
 class TestInputEdgeCases:
     """Tests for edge cases in input validation."""
 
-    def test_empty_string_fields(self):
-        """Test that empty strings are accepted where allowed."""
-        data = FlashcardCreateInput(
-            type_name="Basic",
-            deck_name="Test",
-            front="",  # Empty front
-            back=""    # Empty back
-        )
-        
-        assert data.front == ""
-        assert data.back == ""
-
-    def test_very_long_strings(self):
-        """Test very long string inputs."""
-        long_string = "A" * 10000
-        
-        data = FlashcardCreateInput(
-            type_name="Basic",
-            deck_name="Test",
-            front=long_string,
-            back=long_string
-        )
-        
-        assert len(data.front) == 10000
-        assert len(data.back) == 10000
-
-    def test_unicode_characters(self):
-        """Test unicode characters in inputs."""
-        data = FlashcardCreateInput(
-            type_name="Basic",
-            deck_name="日本語",
-            front="什么是Python？",
-            back="Python是一种编程语言 🐍"
-        )
-        
-        assert data.deck_name == "日本語"
-        assert "Python" in data.front
-        assert "🐍" in data.back
-
-    def test_special_characters(self):
-        """Test special characters in inputs."""
-        data = FlashcardCreateInput(
-            type_name="Basic",
-            deck_name="Deck::SubDeck",
-            front="<script>alert('xss')</script>",
-            back="'\"\\n\\t"
-        )
-        
-        # Should accept special characters (escaping is handled elsewhere)
-        assert "<script>" in data.front
-
-    def test_whitespace_handling(self):
-        """Test whitespace in inputs."""
-        data = FlashcardCreateInput(
-            type_name="  Basic  ",
-            deck_name="  Test Deck  ",
-            front="  Question with spaces  ",
-            back="  Answer with spaces  "
-        )
-        
-        # Whitespace should be preserved
-        assert data.type_name == "  Basic  "
-
-    def test_newlines_in_content(self):
-        """Test newlines in card content."""
-        data = FlashcardCreateInput(
-            type_name="Basic",
-            deck_name="Test",
-            front="Line 1\nLine 2\nLine 3",
-            back="Answer\nWith\nNewlines"
-        )
-        
-        assert "\n" in data.front
-        assert data.front.count("\n") == 2
-
-    def test_zero_values(self):
-        """Test zero values in numeric fields."""
-        data = FlashcardListInput(limit=0, offset=0)
-        
-        assert data.limit == 0
-        assert data.offset == 0
-
-    def test_large_numeric_values(self):
-        """Test large numeric values."""
-        data = FlashcardListInput(
-            limit=1000000,
-            offset=1000000
-        )
-        
-        assert data.limit == 1000000
-        assert data.offset == 1000000
-
     def test_negative_timezone_offset(self):
         """Test negative timezone offset."""
         data = FlashcardCreateInput(